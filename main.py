@@ -5,87 +5,155 @@ Main entry point for the PyBackup GUI application.
 Initializes the Tkinter environment, attempts to apply a suitable
 theme, creates the main application window using the PyBackupGUI class from
 pybackup_gui.py, and starts the Tkinter event loop.
+
+To investigate startup time, launch with ``python -X importtime main.py``;
+the per-module import costs are printed to stderr, which shows the modules
+worth importing lazily.
 """
 
 # Standard library imports
-import tkinter as tk
-from tkinter import ttk
 import sys
 import logging  # Added import
+import tkinter as tk
 
-# Local application imports
-# Ensure pybackup_gui module and PyBackupGUI class are found.
-# Assumes pybackup_gui.py is in the same directory or in the Python path.
-try:
-    from pybackup_gui import PyBackupGUI
-except ImportError as e:
-    # Provide helpful error message if the GUI module cannot be imported
-    print(
-        f"Error: Could not import PyBackupGUI from pybackup_gui.py: {e}", file=sys.stderr)
-    print("Please ensure main.py and pybackup_gui.py are in the same directory.", file=sys.stderr)
-    sys.exit(1)  # Exit with an error code
-except Exception as e:  # pylint: disable=broad-except
-    # Catch other potential errors during import (less common)
-    # Log critical error before exiting if logging is available
-    logging.basicConfig(level=logging.ERROR,
-                        format='%(asctime)s - %(levelname)s - %(message)s')
-    logging.critical(
-        "An unexpected error occurred during GUI import: %s", e, exc_info=True)
-    print(f"An unexpected error occurred during import: {e}", file=sys.stderr)
-    sys.exit(1)
+# Module logger (root handlers are configured in main())
+logger = logging.getLogger(__name__)
 
+# Console logging setup, built once and attached to the root logger in main().
+# Informational records go to stdout, warnings and errors to stderr only.
+_LOG_FORMATTER = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+_CONSOLE_HANDLER = logging.StreamHandler(sys.stdout)
+_CONSOLE_HANDLER.setFormatter(_LOG_FORMATTER)
+_CONSOLE_HANDLER.addFilter(lambda record: record.levelno < logging.WARNING)
+_ERROR_HANDLER = logging.StreamHandler(sys.stderr)
+_ERROR_HANDLER.setFormatter(_LOG_FORMATTER)
+_ERROR_HANDLER.setLevel(logging.WARNING)
 
-if __name__ == "__main__":
-    # Basic logging configuration as a fallback if GUI/core setup fails
-    # The GUI will reconfigure this later with the chosen log file
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(levelname)s - %(message)s',
-        handlers=[logging.StreamHandler(sys.stdout)]
-    )
-
-    # Create the main application window (root)
+
+def _apply_ttk_theme(root: tk.Tk):
+    """
+    Apply the preferred ttk theme for the current platform to root.
+
+    Attempts to use platform-native or good cross-platform themes if
+    available, falling back gracefully if themes are missing or cause errors.
+    tkinter.ttk is imported here, so code paths that skip theming never pay
+    for loading it.
+    """
+    try:
+        from tkinter import ttk  # pylint: disable=import-outside-toplevel
+        style = ttk.Style(root)
+        current_theme = style.theme_use()
+        platform = sys.platform  # Looked up once for all checks below
+
+        # Windows and macOS Tk builds already default to their native theme;
+        # re-applying it would only trigger a full restyle, so skip it.
+        if ((platform == "win32" and current_theme == 'vista') or
+                (platform == "darwin" and current_theme == 'aqua')):
+            logger.debug("Native ttk theme '%s' already active.",
+                         current_theme)
+        else:
+            # Query the theme list from Tcl only once
+            available_themes = frozenset(style.theme_names())
+
+            # Platform-specific theme preferences, followed by good
+            # cross-platform fallbacks. 'default' and 'classic' are usually
+            # available but look older, so they are not listed.
+            if platform == "win32":
+                preferred_themes = ('vista', 'clam', 'alt')
+            elif platform == "darwin":
+                preferred_themes = ('aqua', 'clam', 'alt')
+            else:
+                preferred_themes = ('clam', 'alt')
+
+            # Apply the first available theme (a single theme_use call)
+            chosen_theme = None
+            for theme_name in preferred_themes:
+                if theme_name in available_themes:
+                    if theme_name != current_theme:
+                        style.theme_use(theme_name)
+                    chosen_theme = theme_name
+                    break
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Available ttk themes: %s. Applied theme: %s",
+                             sorted(available_themes), chosen_theme)
+    except tk.TclError as e:
+        # Ignore theme errors and let Tkinter use its default theme
+        logger.warning("Could not apply custom ttk theme: %s", e)
+
+
+def main() -> int:
+    """
+    Create the root window, apply a theme and run the PyBackup GUI.
+
+    Returns:
+        The process exit code: 0 on normal exit, 1 on error.
+    """
+    # Frozen builds (e.g. PyInstaller) import from a bundled archive, so
+    # there is no point in trying to write .pyc files next to them
+    if getattr(sys, 'frozen', False):
+        sys.dont_write_bytecode = True
+
+    # Basic logging configuration as a fallback if GUI/core setup fails.
+    # Configured once, before anything else can log (later basicConfig calls
+    # are no-ops). The GUI will reconfigure this later with the chosen log file
+    root_logger = logging.getLogger()
+    root_logger.addHandler(_CONSOLE_HANDLER)
+    root_logger.addHandler(_ERROR_HANDLER)
+    root_logger.setLevel(logging.INFO)
+
+    # Create the main application window (root) before loading the GUI
+    # module, so the interpreter is not busy importing while the window is
+    # waiting to appear.
     root = tk.Tk()
+    # Keep the window hidden while it is themed and populated, so it is
+    # painted once in its final state instead of flashing unstyled
+    root.withdraw()
+    # Only paths and numbers are typed into this GUI, so the XIM/IME hooks
+    # Tk installs for composed (e.g. CJK) input are not needed; disabling
+    # them removes their overhead from every event handled by mainloop()
+    if sys.platform != 'darwin':
+        try:
+            root.tk.call('tk', 'useinputmethods', '0')
+        except tk.TclError as e:
+            logger.debug("Could not disable Tk input methods: %s", e)
 
-    # --- Optional: Apply a ttk theme for a more modern look ---
-    # This attempts to use platform-native or good cross-platform themes
-    # if available, falling back gracefully if themes are missing or cause errors.
+    # Local application imports
+    # Ensure pybackup_gui module and PyBackupGUI class are found.
+    # Assumes pybackup_gui.py is in the same directory or in the Python path.
     try:
-        style = ttk.Style()
-        available_themes = style.theme_names()
-        logging.debug("Available ttk themes: %s", available_themes)
-
-        # Platform-specific theme preferences
-        if sys.platform == "win32" and 'vista' in available_themes:
-            style.theme_use('vista')
-            logging.debug("Applying 'vista' theme for Windows.")
-        elif sys.platform == "darwin" and 'aqua' in available_themes:
-            style.theme_use('aqua')
-            logging.debug("Applying 'aqua' theme for macOS.")
-        # Good cross-platform fallbacks
-        elif 'clam' in available_themes:
-            style.theme_use('clam')
-            logging.debug("Applying 'clam' theme.")
-        elif 'alt' in available_themes:
-            style.theme_use('alt')
-            logging.debug("Applying 'alt' theme.")
-        # 'default' and 'classic' are usually available but look older
+        from pybackup_gui import PyBackupGUI  # pylint: disable=import-outside-toplevel
+    except ImportError as e:
+        # Provide helpful error message if the GUI module cannot be imported
+        logger.error(
+            "Could not import PyBackupGUI from pybackup_gui.py: %s. "
+            "Please ensure main.py and pybackup_gui.py are in the same directory.", e)
+        return 1  # Exit with an error code
     except Exception as e:  # pylint: disable=broad-except
-        # Ignore theme errors and let Tkinter use its default theme
-        logging.warning("Could not apply custom ttk theme: %s", e)
-        print(f"Note: Could not apply custom ttk theme: {e}", file=sys.stderr)
+        # Catch other potential errors during import (less common)
+        # Log critical error before exiting (logging is already configured)
+        logger.critical(
+            "An unexpected error occurred during GUI import: %s", e, exc_info=True)
+        return 1
+
+    # --- Optional: Apply a ttk theme for a more modern look ---
+    _apply_ttk_theme(root)
 
     # --- Create and run the GUI application instance ---
     try:
         # Instantiate the main GUI class, passing the root window
         app = PyBackupGUI(root)
-        # Start the Tkinter event loop (makes the window interactive)
+        # Show the fully built window, then start the Tkinter event loop
+        # (makes the window interactive)
+        root.deiconify()
         root.mainloop()
     except Exception as e:  # pylint: disable=broad-except
         # Catch potential errors during GUI initialization or the main loop
         # Use logging.exception to include traceback information
-        logging.exception("An error occurred running the application: %s", e)
-        # Also print a user-friendly message to stderr
-        print(
-            f"An error occurred running the application: {e}", file=sys.stderr)
-        sys.exit(1)  # Exit with a general error code
+        # (written to stderr by the error handler)
+        logger.exception("An error occurred running the application: %s", e)
+        return 1  # Exit with a general error code
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
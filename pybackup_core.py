@@ -3,19 +3,27 @@
 Core logic for the PyBackup sequential multi-target backup tool.
 
 Handles directory traversal, file comparison, copying, target switching,
-and communication with the GUI thread. Uses a recursive synchronization
+and communication with the GUI thread. Uses a depth-first synchronization
 approach without a full pre-scan.
 """
 
 import os
 import shutil
+import collections
+import errno
+import stat
 import time
 import logging
 import sys
-import queue  # Used by GUI, not directly here now
+import queue  # For the progress queue type
 import threading  # Used by GUI
-import json  # Import needed for load/save state
-from typing import Optional, Tuple, List, Dict, Any
+import json  # Needed to read legacy JSON state files
+import struct
+import functools
+import operator
+import uuid
+from concurrent.futures import ThreadPoolExecutor, wait as wait_futures
+from typing import Optional, Tuple, List, Dict, Set, Any
 
 # --- Constants ---
 
@@ -36,10 +44,343 @@ IGNORE_DIRS_ON_CLEAR = {
 }
 IGNORE_DIRS_ON_CLEAR_LOWER = {d.lower() for d in IGNORE_DIRS_ON_CLEAR}
 
+# Name prefix of the directories that cleared target contents are moved to
+# before being deleted in the background (see _clear_target_directory)
+TRASH_DIR_PREFIX = '.pybackup-trash-'
+
 # Default values if not found in config dict (used internally as fallback)
 INTERNAL_DEFAULT_FREE_PERCENT = 10
 INTERNAL_DEFAULT_RETRIES = 3
 INTERNAL_DEFAULT_DELAY = 10
+INTERNAL_DEFAULT_COPY_WORKERS = 4
+# File copies submitted ahead per copy worker before the traversal waits
+COPY_QUEUE_DEPTH_PER_WORKER = 4
+# Source subdirectories are listed ahead of the traversal by this many
+# threads, with at most LISTING_PREFETCH_MAX listings pending or unused
+LISTING_PREFETCH_WORKERS = 2
+LISTING_PREFETCH_MAX = 64
+INTERNAL_DEFAULT_LOG_LEVEL = logging.INFO
+# List source directories with _scandir_bulk (Linux, huge directories only)
+INTERNAL_DEFAULT_BULK_LISTING = False
+# Copy runs of files in inode order if the source is on a rotational disk
+INTERNAL_DEFAULT_INODE_ORDER = True
+
+# Free space of a target is re-probed from the OS once this much was written
+# to it, this many files were copied to it, or this many seconds passed,
+# since the last probe
+FREE_SPACE_REFRESH_BYTES = 256 * 1024 * 1024
+FREE_SPACE_REFRESH_FILES = 1000
+FREE_SPACE_REFRESH_SECONDS = 30.0
+# Once the estimated free space is below this multiple of the required
+# margin, the probe is repeated after every quarter of the remaining headroom
+FREE_SPACE_NEAR_THRESHOLD_FACTOR = 1.5
+
+# Minimum interval between two 'status' progress messages (purely
+# informational, so the ones in between are dropped), in nanoseconds
+STATUS_EMIT_INTERVAL_NS = 100_000_000
+# Progress messages are sent to the GUI in 'batch' messages of up to this many
+# events, at least every PROGRESS_BATCH_INTERVAL_NS while events keep coming
+# (and before the traversal blocks)
+PROGRESS_BATCH_SIZE = 64
+PROGRESS_BATCH_INTERVAL_NS = 100_000_000
+# Message types sent on their own, right after the events batched before them
+_UNBATCHED_PROGRESS_TYPES = frozenset(
+    ('target_switch', 'target_full_stats', 'done', 'error', 'cancelled'))
+
+# Buffer size of the userspace fallback used by _copy_data_fast
+COPY_BUFFER_SIZE = 1024 * 1024
+# One fallback copy buffer per copy worker thread, allocated on first use
+_copy_buffer_local = threading.local()
+# Access pattern hints for the copied files (Linux; None where unavailable)
+_posix_fadvise = getattr(os, 'posix_fadvise', None)
+_FADV_SEQUENTIAL = getattr(os, 'POSIX_FADV_SEQUENTIAL', None)
+_FADV_WILLNEED = getattr(os, 'POSIX_FADV_WILLNEED', None)
+_FADV_DONTNEED = getattr(os, 'POSIX_FADV_DONTNEED', None)
+# Errors meaning a kernel copy call is not supported for this pair of files
+# (before any data was copied); the next copy method is tried instead
+_FAST_COPY_UNSUPPORTED_ERRNOS = frozenset(
+    getattr(errno, name) for name in
+    ('EXDEV', 'ENOSYS', 'EINVAL', 'EOPNOTSUPP', 'ENOTSUP', 'ENOTSOCK')
+    if hasattr(errno, name)
+)
+# (source st_dev, destination st_dev) pairs for which copy_file_range and
+# sendfile were found unsupported, so later copies go straight to the next
+# method; None stands for all pairs (the call is missing from the kernel)
+_copy_file_range_unsupported: Set[Optional[Tuple[int, int]]] = set()
+_sendfile_unsupported: Set[Optional[Tuple[int, int]]] = set()
+
+
+# Binary resume state file layout: header (magic, format version, target
+# index, byte length of the last processed path - 0 for none), then the path
+# encoded as UTF-8 (surrogateescape, so any file name round-trips)
+STATE_FILE_MAGIC = b'PBKS'
+STATE_FILE_VERSION = 1
+_STATE_HEADER = struct.Struct('>4sBiI')
+# Only the most recent failures are kept in memory (and sent with the final
+# progress message); all of them are written to the failures file, one JSON
+# object per line, named after the state file
+FAILED_ITEMS_TAIL = 1000
+FAILURES_FILE_SUFFIX = '.failures.jsonl'
+
+# Resume state changes are written by a background thread at most this often,
+# or earlier once this many items were finished since the last write
+STATE_SAVE_INTERVAL_SECONDS = 5.0
+STATE_SAVE_MAX_ITEMS = 500
+
+
+_UNITS = ("B", "KB", "MB", "GB", "TB", "PB", "EB", "ZB", "YB")
+
+
+@functools.lru_cache(maxsize=1024)
+def human_readable_size(size_bytes: float) -> str:
+    """
+    Convert bytes to a human-readable string (e.g. 1536 -> '1.50 KB').
+
+    The unit is picked from the bit length of the size instead of repeated
+    division; results are cached as (rounded) sizes repeat a lot.
+    """
+    if size_bytes <= 0:
+        return "0B"
+    i = min((int(size_bytes).bit_length() - 1) // 10, len(_UNITS) - 1)
+    return f"{size_bytes / (1 << (i * 10)):.2f} {_UNITS[i]}"
+
+
+# Sort key for DirEntry lists
+_ENTRY_NAME = operator.attrgetter('name')
+_ENTRY_INODE = operator.methodcaller('inode')
+
+_SEPARATORS = (os.sep, os.altsep) if os.altsep else (os.sep,)
+
+
+def _dir_prefix(path: str) -> str:
+    """Return path with exactly one trailing separator (e.g. '/src' -> '/src/')."""
+    return path if path.endswith(_SEPARATORS) else path + os.sep
+
+
+def _lstat_or_none(path: str) -> Optional[os.stat_result]:
+    """
+    Return os.lstat(path), or None if nothing exists there.
+
+    A single call answers both "does it exist" and "is it a link" (check
+    stat.S_ISLNK on the result), instead of os.path.exists plus islink.
+
+    Raises:
+        OSError: For errors other than the path (or a parent) not existing.
+    """
+    try:
+        return os.lstat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+def _make_dest_dir(path: str):
+    """
+    Create a directory whose parent normally exists, like os.makedirs.
+
+    A single mkdir call in the common case, where os.makedirs stats the
+    parent first. An existing directory is accepted (as with exist_ok=True)
+    and a missing parent is still created.
+
+    Raises:
+        OSError: If the directory cannot be created, or a non-directory is
+                 in the way.
+    """
+    try:
+        os.mkdir(path)
+    except FileExistsError:
+        if not os.path.isdir(path):
+            raise
+    except FileNotFoundError:
+        os.makedirs(path, exist_ok=True)
+
+
+def _is_rotational(path: str) -> bool:
+    """
+    Return True if path is on a rotational (spinning) disk.
+
+    Reads the queue/rotational flag of the block device from sysfs (for a
+    partition, the flag of its disk). Always False where this cannot be
+    determined (not Linux, virtual file systems...).
+    """
+    if not sys.platform.startswith('linux'):
+        return False
+    try:
+        dev = os.stat(path).st_dev
+    except OSError:
+        return False
+    device_dir = f"/sys/dev/block/{os.major(dev)}:{os.minor(dev)}"
+    for flag_file in (device_dir + '/queue/rotational',
+                      device_dir + '/../queue/rotational'):
+        try:
+            with open(flag_file, 'rb') as f:
+                return f.read(1) == b'1'
+        except OSError:
+            continue
+    return False
+
+
+def _fadvise(fd: int, *advice: Optional[int]):
+    """Apply posix_fadvise hints to a whole file, ignoring any failure."""
+    if _posix_fadvise is None:
+        return
+    for adv in advice:
+        try:
+            _posix_fadvise(fd, 0, 0, adv)
+        except OSError:
+            return  # Unsupported here (e.g. on some FUSE file systems)
+
+
+# --- Bulk directory listing (Linux getdents64) ---
+
+# getdents64 syscall numbers by machine (the generic table is used by arm64,
+# riscv64 and loongarch64)
+_GETDENTS64_SYSCALLS = {
+    'x86_64': 217, 'amd64': 217, 'i386': 220, 'i686': 220,
+    'aarch64': 61, 'arm64': 61, 'riscv64': 61, 'loongarch64': 61,
+    'armv7l': 217, 'armv6l': 217,
+}
+# Header of struct linux_dirent64: d_ino, d_off, d_reclen, d_type (d_name follows)
+_DIRENT64_HEADER = struct.Struct('=QqHB')
+_DT_UNKNOWN, _DT_DIR, _DT_REG, _DT_LNK = 0, 4, 8, 10
+BULK_LISTING_BUFFER_SIZE = 1024 * 1024
+_getdents64 = None  # (syscall function, number) once loaded; False if unusable
+# One listing buffer per thread, allocated on first use and then reused
+_bulk_listing_local = threading.local()
+
+
+def _load_getdents64():
+    """Return the libc syscall function and getdents64 number, or None."""
+    global _getdents64  # pylint: disable=global-statement
+    if _getdents64 is None:
+        _getdents64 = False
+        syscall_nr = _GETDENTS64_SYSCALLS.get(os.uname().machine) \
+            if sys.platform.startswith('linux') else None
+        if syscall_nr is not None:
+            try:
+                import ctypes  # pylint: disable=import-outside-toplevel
+                libc = ctypes.CDLL(None, use_errno=True)
+                syscall = libc.syscall
+                syscall.restype = ctypes.c_long
+                syscall.argtypes = (ctypes.c_long, ctypes.c_int,
+                                    ctypes.c_char_p, ctypes.c_size_t)
+                _getdents64 = (syscall, syscall_nr, ctypes)
+            except (ImportError, OSError, AttributeError) as e:
+                logging.debug("getdents64 not available: %s", e)
+    return _getdents64 or None
+
+
+class _BulkDirEntry:
+    """
+    Minimal os.DirEntry stand-in for the entries listed by _scandir_bulk.
+
+    The file type comes from the listing (d_type); stat calls are only made
+    when the file system reports an unknown type or a stat is requested.
+    """
+    __slots__ = ('name', 'path', '_d_type', '_ino', '_lstat', '_stat')
+
+    def __init__(self, dir_prefix: str, name: str, d_type: int, ino: int):
+        self.name = name
+        self.path = dir_prefix + name
+        self._d_type = d_type
+        self._ino = ino
+        self._lstat = None
+        self._stat = None
+
+    def __repr__(self):
+        return f"<_BulkDirEntry {self.name!r}>"
+
+    def inode(self) -> int:
+        """Return the inode number of the entry."""
+        return self._ino
+
+    def stat(self, *, follow_symlinks: bool = True) -> os.stat_result:
+        """Return (and cache) the stat result, like os.DirEntry.stat."""
+        if follow_symlinks and self.is_symlink():
+            if self._stat is None:
+                self._stat = os.stat(self.path)
+            return self._stat
+        if self._lstat is None:
+            self._lstat = os.lstat(self.path)
+        return self._lstat
+
+    def is_symlink(self) -> bool:
+        """Return True if the entry is a symbolic link."""
+        if self._d_type != _DT_UNKNOWN:
+            return self._d_type == _DT_LNK
+        return stat.S_ISLNK(self.stat(follow_symlinks=False).st_mode)
+
+    def _has_type(self, d_type: int, test, follow_symlinks: bool) -> bool:
+        if self._d_type != _DT_UNKNOWN and not (follow_symlinks and self._d_type == _DT_LNK):
+            return self._d_type == d_type
+        try:
+            return test(self.stat(follow_symlinks=follow_symlinks).st_mode)
+        except FileNotFoundError:
+            return False
+
+    def is_dir(self, *, follow_symlinks: bool = True) -> bool:
+        """Return True if the entry is (follow_symlinks: points to) a directory."""
+        return self._has_type(_DT_DIR, stat.S_ISDIR, follow_symlinks)
+
+    def is_file(self, *, follow_symlinks: bool = True) -> bool:
+        """Return True if the entry is (follow_symlinks: points to) a file."""
+        return self._has_type(_DT_REG, stat.S_ISREG, follow_symlinks)
+
+
+def _scandir_bulk(path: str) -> Optional[List[_BulkDirEntry]]:
+    """
+    List a directory with large getdents64 calls (Linux only).
+
+    os.scandir reads a directory through libc's readdir buffer (about 32 KiB
+    per system call); reading BULK_LISTING_BUFFER_SIZE at once takes far fewer
+    calls for directories with very many entries.
+
+    Args:
+        path: The directory to list.
+
+    Returns:
+        The entries ('.' and '..' excluded), or None if bulk listing is not
+        supported here (the caller should use os.scandir).
+
+    Raises:
+        OSError: If the directory cannot be opened or read.
+    """
+    loaded = _load_getdents64()
+    if loaded is None:
+        return None
+    syscall, syscall_nr, ctypes = loaded
+    buffer = getattr(_bulk_listing_local, 'buffer', None)
+    if buffer is None:
+        buffer = _bulk_listing_local.buffer = \
+            ctypes.create_string_buffer(BULK_LISTING_BUFFER_SIZE)
+    string_at = ctypes.string_at
+    header_size = _DIRENT64_HEADER.size
+    unpack_header = _DIRENT64_HEADER.unpack_from
+    fsdecode = os.fsdecode
+    dir_prefix = _dir_prefix(path)  # Same entry paths as os.scandir
+    entries = []
+    fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY | getattr(os, 'O_CLOEXEC', 0))
+    try:
+        while True:
+            nread = syscall(syscall_nr, fd, buffer, BULK_LISTING_BUFFER_SIZE)
+            if nread < 0:
+                err = ctypes.get_errno()
+                if not entries and err in (errno.ENOSYS, errno.EOPNOTSUPP, errno.EINVAL):
+                    return None
+                raise OSError(err, os.strerror(err), path)
+            if nread == 0:
+                return entries
+            data = string_at(buffer, nread)  # Only the bytes read, not the whole buffer
+            offset = 0
+            while offset < nread:
+                d_ino, _d_off, d_reclen, d_type = unpack_header(data, offset)
+                name_end = data.index(b'\0', offset + header_size, offset + d_reclen)
+                name = data[offset + header_size:name_end]
+                offset += d_reclen
+                if name in (b'.', b'..'):
+                    continue
+                entries.append(_BulkDirEntry(dir_prefix, fsdecode(name), d_type, d_ino))
+    finally:
+        os.close(fd)
 
 
 # --- Backup Engine Class ---
@@ -51,8 +392,8 @@ class BackupEngine:
     """
 
     def __init__(self, source_dir: str, target_dirs: List[str],
-                 config: Dict[str, Any], progress_queue: queue.Queue,
-                 log_queue: queue.Queue, pause_event: threading.Event,
+                 config: Dict[str, Any], progress_queue: queue.SimpleQueue,
+                 log_queue: collections.deque, resume_event: threading.Event,
                  cancel_event: threading.Event, state_file: str):
         """
         Initialize the BackupEngine.
@@ -61,32 +402,72 @@ class BackupEngine:
             source_dir: Absolute path to the source directory.
             target_dirs: List of absolute paths to target directories.
             config: Dictionary containing configuration like 'free_percent',
-                    'retries', 'delay'. Values MUST be provided by caller.
-            progress_queue: Queue to send progress/status updates to the GUI.
-            log_queue: Queue to send log messages to the GUI.
-            pause_event: Threading event to signal pause request.
+                    'retries', 'delay'. Values MUST be provided by caller
+                    ('copy_workers', the number of parallel file copies,
+                    'log_level', the minimum level of log messages sent
+                    to log_queue, 'bulk_listing', to list source
+                    directories with _scandir_bulk, and 'inode_order', to
+                    copy files in inode order from rotational disks, are
+                    optional).
+            progress_queue: Queue to send progress/status updates to the GUI
+                            (unbounded, so put() never blocks).
+            log_queue: Deque the log messages are appended to for the GUI
+                       (append and popleft are atomic, so no lock is needed;
+                       a bounded deque drops the oldest messages).
+            resume_event: Threading event, set while running and cleared to
+                          pause (the worker blocks on it, without polling).
             cancel_event: Threading event to signal cancellation request.
-            state_file: Path to the JSON file for saving/loading resume state.
+                          Setting it should also set resume_event, so a
+                          paused worker wakes up to cancel.
+            state_file: Path to the file for saving/loading resume state
+                        (binary format; legacy JSON state is still read).
         """
-        self.source_dir: str = source_dir
+        # Normalized once, so that every traversed path starts with the
+        # source prefix and destinations can be derived by slicing
+        self.source_dir: str = os.path.normpath(source_dir)
+        self._source_dir_prefix: str = _dir_prefix(self.source_dir)
+        self._source_dir_prefix_len: int = len(self._source_dir_prefix)
         self.target_dirs: List[str] = target_dirs
         self.config: Dict[str, Any] = config
         self.config.setdefault('free_percent', INTERNAL_DEFAULT_FREE_PERCENT)
         self.config.setdefault('retries', INTERNAL_DEFAULT_RETRIES)
         self.config.setdefault('delay', INTERNAL_DEFAULT_DELAY)
-
-        self.progress_queue: queue.Queue = progress_queue
-        self.log_queue: queue.Queue = log_queue
-        self.pause_event: threading.Event = pause_event
+        self.config.setdefault('copy_workers', INTERNAL_DEFAULT_COPY_WORKERS)
+        self._copy_workers: int = max(1, int(self.config['copy_workers']))
+        self.config.setdefault('log_level', INTERNAL_DEFAULT_LOG_LEVEL)
+        self.config.setdefault('bulk_listing', INTERNAL_DEFAULT_BULK_LISTING)
+        self.config.setdefault('inode_order', INTERNAL_DEFAULT_INODE_ORDER)
+        # Set by run_backup once the source disk type is known
+        self._inode_order: bool = False
+        # Log messages below this level are dropped before reaching the queue
+        self._min_emit_level: int = self.config['log_level']
+
+        self.progress_queue: queue.SimpleQueue = progress_queue
+        self.log_queue: collections.deque = log_queue
+        self.resume_event: threading.Event = resume_event
         self.cancel_event: threading.Event = cancel_event
         self.state_file: str = state_file
 
         # Runtime state initialized by _load_resume_state
         self.target_index: int = 0
         self.current_target_base: Optional[str] = None
+        self._target_prefix: str = ''  # current_target_base plus separator
         self.targets_initialized_this_run: List[str] = []
+        # Targets whose clear removed every item (see _open_directory)
+        self._fully_cleared_targets: Set[str] = set()
         self.last_processed_path: Optional[str] = None
         self.is_resuming: bool = False
+        # last_processed_path split into path components relative to
+        # source_dir; tuple order matches the name-sorted traversal order
+        self._resume_cursor_parts: Optional[Tuple[str, ...]] = None
+        # Debounced state saving (see _start_state_saver): the traversal only
+        # marks the state dirty, a background thread writes it periodically
+        self._state_lock = threading.RLock()
+        self._state_dirty = threading.Event()
+        self._items_since_state_save: int = 0
+        self._state_saver_wake = threading.Event()  # Set to save (or stop) early
+        self._state_saver_stop = threading.Event()
+        self._state_saver: Optional[threading.Thread] = None
 
         # Statistics for the current run (reset each time)
         self.total_items_processed_this_run: int = 0
@@ -94,39 +475,108 @@ class BackupEngine:
         self.items_processed_this_target: int = 0
         self.size_copied_this_target: int = 0
         self.last_item_logged_this_target: str = "N/A"  # For target full message
-        self.failed_items: List[Tuple[str, str]] = []
+        # Most recent (path, reason) failures; failed_count counts them all
+        self.failed_items: collections.deque = collections.deque(maxlen=FAILED_ITEMS_TAIL)
+        self.failed_count: int = 0
+        self.failures_file: str = state_file + FAILURES_FILE_SUFFIX
+        self._failures_out = None  # Opened on the first failure of the run
+        # Time of the last 'status' message sent (see _emit_progress)
+        self._last_status_emit_ns: int = 0
+        # (type, fields) progress events not sent yet and the time the oldest
+        # one was added (see _emit_progress); copy workers emit too, hence the lock
+        self._progress_batch: List[Tuple[str, Dict[str, Any]]] = []
+        self._progress_batch_start_ns: int = 0
+        self._progress_lock = threading.Lock()
+        # Total size of the file copies submitted but not yet retired
+        self._inflight_bytes: int = 0
+        # target base -> [total, free_at_last_probe, bytes_written_since_probe,
+        # probe_time (monotonic), files_written_since_probe,
+        # bytes_allowed_before_next_probe], see _get_free_space_margin
+        self._free_space_cache: Dict[str, List[float]] = {}
+        # Copy worker threads, created once per run by run_backup
+        self._copy_pool: Optional[ThreadPoolExecutor] = None
+        # Threads listing source directories ahead of the traversal (created
+        # by run_backup) and source dir -> future of its entries
+        self._listing_pool: Optional[ThreadPoolExecutor] = None
+        self._prefetched_listings: Dict[str, Any] = {}
+        # target base -> thread deleting the trash moved aside while clearing it
+        self._trash_threads: Dict[str, threading.Thread] = {}
+
+    def _emit_log(self, level: int, message: str, *args, **kwargs):
+        """
+        Safely append a log message to the log queue.
 
-    def _emit_log(self, level: int, message: str, **kwargs):
-        """Safely put a log message onto the log queue."""
+        Like the logging module, messages below the configured level are
+        dropped first, and message is only %-formatted with args when the
+        record is actually queued.
+        """
+        if level < self._min_emit_level:
+            return
         try:
+            if args:
+                message = message % args
             log_record = {'level': level, 'message': message}
             log_record.update(kwargs)
-            self.log_queue.put(log_record)
-        except (queue.Full, TypeError) as e:
+            self.log_queue.append(log_record)
+        except TypeError as e:
             # Avoid crashing the core logic if GUI queue fails
             print(f"ERROR: Failed to queue log message: {e}", file=sys.stderr)
 
-    def _emit_progress(self, msg_type: str, **kwargs):
-        """Safely put a progress update onto the progress queue."""
-        try:
+    def _emit_progress(self, msg_type: str, *, force: bool = False, **kwargs):
+        """
+        Safely put a progress update onto the progress queue.
+
+        'status' messages only describe the current activity, so they are
+        throttled to one per STATUS_EMIT_INTERVAL_NS (unless force is set,
+        for a status that must not be lost, e.g. before a long wait); all
+        other message types (item_start, item_done, target_switch...) are
+        always sent.
+
+        Events are queued in batches ({'type': 'batch', 'events': [(type,
+        fields), ...]}, see _flush_progress) rather than one message each;
+        the types in _UNBATCHED_PROGRESS_TYPES flush the batch and are then
+        sent as single messages.
+        """
+        now = time.monotonic_ns()
+        if msg_type == 'status':
+            if (not force and
+                    now - self._last_status_emit_ns < STATUS_EMIT_INTERVAL_NS):
+                return
+            self._last_status_emit_ns = now
+        if msg_type in _UNBATCHED_PROGRESS_TYPES:
+            self._flush_progress()
             payload = {'type': msg_type}
             payload.update(kwargs)
+            self._put_progress(payload)
+            return
+        with self._progress_lock:
+            batch = self._progress_batch
+            if not batch:
+                self._progress_batch_start_ns = now
+            batch.append((msg_type, kwargs))
+            if (len(batch) < PROGRESS_BATCH_SIZE and
+                    now - self._progress_batch_start_ns < PROGRESS_BATCH_INTERVAL_NS):
+                return
+            self._progress_batch = []
+        self._put_progress({'type': 'batch', 'events': batch})
+
+    def _flush_progress(self):
+        """Send the batched progress events now (e.g. before blocking)."""
+        with self._progress_lock:
+            batch = self._progress_batch
+            if not batch:
+                return
+            self._progress_batch = []
+        self._put_progress({'type': 'batch', 'events': batch})
+
+    def _put_progress(self, payload: Dict[str, Any]):
+        """Put one message onto the progress queue."""
+        try:
             self.progress_queue.put(payload)
-        except (queue.Full, TypeError) as e:
+        except TypeError as e:
             print(
                 f"ERROR: Failed to queue progress message: {e}", file=sys.stderr)
 
-    def _human_readable_size(self, size_bytes: float) -> str:
-        """Convert bytes to a human-readable string."""
-        if size_bytes == 0:
-            return "0B"
-        size_name = ("B", "KB", "MB", "GB", "TB", "PB", "EB", "ZB", "YB")
-        i = 0
-        while size_bytes >= 1024 and i < len(size_name) - 1:
-            size_bytes /= 1024.0
-            i += 1
-        return f"{size_bytes:.2f} {size_name[i]}"
-
     def _get_disk_usage(self, path: str) -> Optional[Any]:
         """Get disk usage for the filesystem containing the specified path."""
         abs_path = os.path.abspath(path)
@@ -145,131 +595,450 @@ class BackupEngine:
                 # Log if both attempts fail
                 self._emit_log(
                     logging.ERROR,
-                    f"Could not determine disk usage for path '{abs_path}'. Error: {e}"
+                    "Could not determine disk usage for path '%s'. Error: %s", abs_path, e
                 )
                 return None
 
-    def _get_free_space_margin(self, path: str) -> Tuple[float, float]:
-        """Calculate required free space margin and current free space."""
-        usage = self._get_disk_usage(path)
-        if usage:
+    def _get_free_space_margin(self, path: str,
+                               force_probe: bool = False) -> Tuple[float, float]:
+        """
+        Calculate required free space margin and current free space.
+
+        The OS is only queried every FREE_SPACE_REFRESH_BYTES or
+        FREE_SPACE_REFRESH_FILES written to the target (see
+        _record_bytes_written) or FREE_SPACE_REFRESH_SECONDS; in between, the
+        free space is estimated from the last probe. Close to the margin, the
+        byte interval shrinks to a quarter of the remaining headroom.
+
+        Args:
+            path: The target base directory.
+            force_probe: If True, always query the OS (e.g. before deciding
+                         that the target is full).
+        """
+        cached = self._free_space_cache.get(path)
+        now = time.monotonic()
+        if (not force_probe and cached is not None and
+                cached[2] <= cached[5] and
+                cached[4] < FREE_SPACE_REFRESH_FILES and
+                now - cached[3] <= FREE_SPACE_REFRESH_SECONDS):
+            total, free = cached[0], cached[1] - cached[2]
+        else:
+            usage = self._get_disk_usage(path)
+            if usage:
+                total, free = usage.total, usage.free
+                refresh_bytes = FREE_SPACE_REFRESH_BYTES
+                margin = total * (self.config['free_percent'] / 100.0)
+                if free < margin * FREE_SPACE_NEAR_THRESHOLD_FACTOR:
+                    refresh_bytes = min(refresh_bytes, max(0, int(free - margin)) // 4)
+                self._free_space_cache[path] = [total, free, 0, now, 0, refresh_bytes]
+            else:
+                total = None
+        if total is not None:
             # Read percentage from config stored in the instance
             free_perc = self.config['free_percent']
-            required_margin = usage.total * (free_perc / 100.0)
-            return required_margin, usage.free
+            required_margin = total * (free_perc / 100.0)
+            return required_margin, free
         else:
             # Cannot determine usage, skip check but log warning
             self._emit_log(
                 logging.WARNING,
-                f"Cannot determine disk usage for '{path}'. Free space check skipped."
+                "Cannot determine disk usage for '%s'. Free space check skipped.", path
             )
             return 0, 0  # Assume check passes if usage unknown
 
+    def _record_bytes_written(self, path: str, size: int):
+        """Account for a file written to a target since its last free space probe."""
+        cached = self._free_space_cache.get(path)
+        if cached is not None:
+            cached[2] += size
+            cached[4] += 1
+
     def _clear_target_directory(self, target_path: str) -> bool:
         """Remove contents of target dir, skipping predefined folders."""
         self._emit_log(
-            logging.INFO, f"Clearing contents of target directory: {target_path}")
+            logging.INFO, "Clearing contents of target directory: %s", target_path)
         try:
             os.makedirs(target_path, exist_ok=True)
         except OSError as e:
             self._emit_log(
-                logging.ERROR, f"Failed create/access target '{target_path}': {e}. Stop clear.")
+                logging.ERROR, "Failed create/access target '%s': %s. Stop clear.",
+                target_path, e)
             return False
 
         items_cleared_or_skipped = 0
         items_failed_to_clear = 0
+        trash_dir = None  # Created on first directory to remove
         try:
-            # Iterate through items directly inside the target path
-            for item_name in os.listdir(target_path):
+            # Iterate through items directly inside the target path.
+            # scandir entries carry the file type from the directory listing,
+            # so the type checks below need no extra stat calls.
+            with os.scandir(target_path) as it:
+                entries = list(it)
+            for entry in entries:
                 if self.cancel_event.is_set():
                     return False  # Check cancellation
-                item_path = os.path.join(target_path, item_name)
+                item_path = entry.path
 
                 # Skip ignored system/hidden directories
-                if item_name.lower() in IGNORE_DIRS_ON_CLEAR_LOWER:
+                if entry.name.lower() in IGNORE_DIRS_ON_CLEAR_LOWER:
                     self._emit_log(
-                        logging.INFO, f"Skipping ignored item during clear: {item_path}")
+                        logging.INFO, "Skipping ignored item during clear: %s", item_path)
                     items_cleared_or_skipped += 1
                     continue
 
                 # Attempt to remove the item based on its type
                 try:
-                    if os.path.islink(item_path) or os.path.isfile(item_path):
-                        logging.debug("Removing during clear: %s", item_path)
+                    if entry.is_symlink() or entry.is_file():
+                        self._emit_log(
+                            logging.DEBUG, "Removing during clear: %s", item_path)
                         os.remove(item_path)
                         items_cleared_or_skipped += 1
-                    elif os.path.isdir(item_path):
-                        logging.debug(
-                            "Removing tree during clear: %s", item_path)
-                        shutil.rmtree(item_path)
+                    elif entry.is_dir():
+                        # Move the tree aside (a quick rename) and delete it in
+                        # the background, so copying can start right away
+                        if trash_dir is None:
+                            trash_dir = os.path.join(
+                                target_path, TRASH_DIR_PREFIX + uuid.uuid4().hex)
+                            try:
+                                os.mkdir(trash_dir)
+                            except OSError as e:
+                                self._emit_log(
+                                    logging.DEBUG, "Cannot create trash dir %s: %s",
+                                    trash_dir, e)
+                                trash_dir = ''  # Delete trees in place instead
+                        try:
+                            if not trash_dir:
+                                raise OSError("no trash directory")
+                            os.rename(item_path, os.path.join(trash_dir, entry.name))
+                        except OSError:
+                            self._emit_log(
+                                logging.DEBUG, "Removing tree during clear: %s", item_path)
+                            self._fast_rmtree(item_path)
                         items_cleared_or_skipped += 1
                     else:
-                        logging.warning(
+                        self._emit_log(
+                            logging.WARNING,
                             "Skipping unknown item type during clear: %s", item_path)
                         items_cleared_or_skipped += 1
                 except OSError as e:  # Catch errors removing individual items
                     self._emit_log(
-                        logging.WARNING, f"Failed remove item during clear {item_path}: {e}. Skip.")
+                        logging.WARNING, "Failed remove item during clear %s: %s. Skip.",
+                        item_path, e)
                     items_failed_to_clear += 1
 
             # Log summary of the clear operation for this directory
             if items_failed_to_clear > 0:
                 self._emit_log(
                     logging.WARNING,
-                    f"Finished clear attempt: {target_path}. "
-                    f"{items_failed_to_clear} items failed removal."
+                    "Finished clear attempt: %s. %s items failed removal.",
+                    target_path, items_failed_to_clear
                 )
             else:
                 self._emit_log(
                     logging.INFO,
-                    f"Finished clear attempt: {target_path}. "
-                    f"{items_cleared_or_skipped} items cleared or skipped."
+                    "Finished clear attempt: %s. %s items cleared or skipped.",
+                    target_path, items_cleared_or_skipped
                 )
+                self._fully_cleared_targets.add(target_path)
             return True  # Clearing attempt finished
 
         except OSError as e:  # Catch errors listing the directory itself
             self._emit_log(
-                logging.ERROR, f"Failed list/clear target '{target_path}': {e}.")
+                logging.ERROR, "Failed list/clear target '%s': %s.", target_path, e)
+            return False
+        finally:
+            if trash_dir:
+                self._start_trash_drain(target_path, trash_dir)
+
+    @staticmethod
+    def _fast_rmtree(path: str):
+        """
+        Delete a directory tree with one unlink/rmdir call per entry.
+
+        Descends iteratively with os.scandir, taking the entry types from
+        the listing (links are never followed) and removing files as they
+        are listed, then removes the directories deepest first; unlike
+        shutil.rmtree, no per-entry stat or path.* calls are made. Windows
+        uses shutil.rmtree, which knows how to treat junctions.
+
+        Raises:
+            OSError: If an entry cannot be listed or removed.
+        """
+        if os.name == 'nt':
+            shutil.rmtree(path)
+            return
+        unlink = os.unlink
+        to_visit = [path]
+        dirs = []  # Pre-order: every directory comes after its parent
+        while to_visit:
+            current = to_visit.pop()
+            dirs.append(current)
+            with os.scandir(current) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        to_visit.append(entry.path)
+                    else:
+                        unlink(entry.path)
+        for dir_path in reversed(dirs):
+            os.rmdir(dir_path)
+
+    def _start_trash_drain(self, target_path: str, trash_dir: str):
+        """Delete a trash directory of a target in a background thread."""
+        def _drain():
+            try:
+                self._fast_rmtree(trash_dir)
+                logging.debug("Deleted trash directory: %s", trash_dir)
+            except OSError as e:
+                self._emit_log(
+                    logging.WARNING,
+                    "Failed to delete cleared items in %s: %s", trash_dir, e)
+
+        thread = threading.Thread(target=_drain, name='pybackup-trash', daemon=True)
+        self._trash_threads[target_path] = thread
+        thread.start()
+
+    def _wait_for_trash(self, target_path: Optional[str] = None):
+        """
+        Wait until background trash deletion has finished.
+
+        Args:
+            target_path: Only wait for this target base (all targets if None).
+        """
+        for path in ([target_path] if target_path is not None
+                     else list(self._trash_threads)):
+            thread = self._trash_threads.pop(path, None)
+            if thread is not None:
+                # Shown on the source root row (the GUI only displays statuses
+                # of a 'current_dir' or 'item' under the source); never
+                # throttled away, as the wait can be long
+                self._emit_progress(
+                    'status', force=True,
+                    message="Waiting for cleared items to be deleted...",
+                    current_dir=self.source_dir, destination_path=path)
+                self._flush_progress()
+                thread.join()
+                # Deleting freed space: forget any free space probed before
+                self._free_space_cache.pop(path, None)
+
+    @staticmethod
+    def _copy_data_fast(src_file: str, dest_file: str):
+        """
+        Copy the contents of a regular file, letting the kernel move the data.
+
+        On Linux, tries os.copy_file_range, then os.sendfile, before falling
+        back to a read/write loop over a reused COPY_BUFFER_SIZE buffer. A method
+        found unsupported between two devices is not tried again for them.
+        Other platforms use shutil.copyfile, which has its own native fast
+        paths (e.g. fcopyfile on macOS). Metadata is not copied.
+
+        Args:
+            src_file: Path of the source file.
+            dest_file: Path of the destination file (created or truncated).
+
+        Raises:
+            OSError: If the files cannot be opened, read or written.
+        """
+        if not sys.platform.startswith('linux'):
+            shutil.copyfile(src_file, dest_file)
+            return
+
+        with open(src_file, 'rb') as fsrc, open(dest_file, 'wb') as fdst:
+            src_fd = fsrc.fileno()
+            dst_fd = fdst.fileno()
+            src_st = os.fstat(src_fd)
+            # The data is read and written once, front to back: ask for
+            # aggressive readahead on the source, and drop the pages of both
+            # files from the page cache afterwards (so a large backup does not
+            # evict everything else cached)
+            _fadvise(src_fd, _FADV_SEQUENTIAL, _FADV_WILLNEED)
+            try:
+                BackupEngine._copy_fd_data(src_fd, dst_fd, src_st)
+            finally:
+                _fadvise(src_fd, _FADV_DONTNEED)
+                _fadvise(dst_fd, _FADV_DONTNEED)
+
+    @staticmethod
+    def _copy_fd_data(src_fd: int, dst_fd: int, src_st: os.stat_result):
+        """
+        Copy all data from src_fd to dst_fd (both at position 0), see _copy_data_fast.
+
+        Raises:
+            OSError: If the data cannot be read or written.
+        """
+        devices = (src_st.st_dev, os.fstat(dst_fd).st_dev)
+        # Large chunks keep the number of syscalls low (1 GiB at most)
+        chunk_size = min(max(src_st.st_size, 8 * COPY_BUFFER_SIZE),
+                         1024 * COPY_BUFFER_SIZE)
+
+        copy_file_range = getattr(os, 'copy_file_range', None)
+        if (copy_file_range is not None and
+                None not in _copy_file_range_unsupported and
+                devices not in _copy_file_range_unsupported):
+            copied_total = 0
+            try:
+                # Uses and advances the file positions of both descriptors
+                while True:
+                    copied = copy_file_range(src_fd, dst_fd, chunk_size)
+                    if copied == 0:
+                        return
+                    copied_total += copied
+            except OSError as e:
+                if copied_total or e.errno not in _FAST_COPY_UNSUPPORTED_ERRNOS:
+                    raise
+                _copy_file_range_unsupported.add(
+                    None if e.errno == errno.ENOSYS else devices)
+
+        if None not in _sendfile_unsupported and devices not in _sendfile_unsupported:
+            offset = 0
+            try:
+                while True:
+                    sent = os.sendfile(dst_fd, src_fd, offset, chunk_size)
+                    if sent == 0:
+                        return
+                    offset += sent
+            except OSError as e:
+                if offset or e.errno not in _FAST_COPY_UNSUPPORTED_ERRNOS:
+                    raise
+                _sendfile_unsupported.add(
+                    None if e.errno == errno.ENOSYS else devices)
+
+        # Nothing was copied by the kernel methods, positions are still 0.
+        # Read into a reused buffer: os.readv and os.write release the GIL
+        # like the kernel copy calls, and no bytes object is created per chunk
+        buffer = getattr(_copy_buffer_local, 'buffer', None)
+        if buffer is None:
+            buffer = _copy_buffer_local.buffer = bytearray(COPY_BUFFER_SIZE)
+        view = memoryview(buffer)
+        buffers = [buffer]
+        readv, write = os.readv, os.write
+        while True:
+            nread = readv(src_fd, buffers)
+            if nread == 0:
+                return
+            written = 0
+            while written < nread:
+                written += write(dst_fd, view[written:nread])
+
+    def _needs_copy(self, src_stat: os.stat_result, dest_file: str,
+                    dest_entries: Optional[Dict[str, os.DirEntry]] = None) -> bool:
+        """
+        Check if a source file must be copied over its destination.
+
+        Compares the cached source stat with a single lstat of the destination:
+        an existing destination file is kept if its size matches and the
+        source is not newer (mtime compared in whole seconds).
+
+        Args:
+            src_stat: Stat result of the source file (not following links).
+            dest_file: Path of the destination file.
+            dest_entries: Listing of the destination directory (name ->
+                          DirEntry), if known to be current. A file missing
+                          from it needs no stat call at all.
+
+        Returns:
+            True if the file has to be copied, False if it can be skipped.
+        """
+        try:
+            if dest_entries is not None:
+                dest_entry = dest_entries.get(os.path.basename(dest_file))
+                if dest_entry is None:
+                    return True
+                dest_stat = dest_entry.stat(follow_symlinks=False)
+            else:
+                dest_stat = _lstat_or_none(dest_file)
+                if dest_stat is None:
+                    return True
+        except FileNotFoundError:
+            return True
+        except (OSError, ValueError) as e:
+            # If metadata comparison fails, assume copy is needed
+            self._emit_log(logging.WARNING,
+                           "Meta compare error: %s. Will copy.", e)
+            return True
+
+        if stat.S_ISLNK(dest_stat.st_mode):
+            return True  # A link at the destination is replaced by the copy
+        # Skip if size matches and source is not newer
+        if (src_stat.st_size == dest_stat.st_size and
+                int(src_stat.st_mtime) <= int(dest_stat.st_mtime)):
+            self._emit_log(
+                logging.INFO, "Skip matching file: %s", dest_file)
             return False
+        self._emit_log(
+            logging.WARNING, "Dest differs: %s. Overwrite.", dest_file)
+        return True
 
-    def _copy_file_with_retry(self, src_file: str, dest_file: str) -> bool:
-        """Copy a single file with metadata preservation and retry logic."""
+    def _copy_file_data(self, src_file: str, dest_file: str, src_is_link: bool):
+        """Copy one file (or link) with its metadata, without following links."""
+        if src_is_link:
+            shutil.copy2(src_file, dest_file, follow_symlinks=False)
+        else:
+            self._copy_data_fast(src_file, dest_file)
+            shutil.copystat(src_file, dest_file, follow_symlinks=False)
+
+    def _copy_file_with_retry(self, src_file: str, dest_file: str,
+                              src_stat: Optional[os.stat_result] = None) -> bool:
+        """
+        Copy a single file with metadata preservation and retry logic.
+
+        Args:
+            src_file: Path of the source file.
+            dest_file: Path of the destination file.
+            src_stat: Stat result already obtained for src_file (not following
+                      links), if any. Otherwise the source is stat-ed once
+                      here; the result serves all attempts.
+        """
         retries = self.config['retries']
         delay = self.config['delay']
 
+        if src_stat is None:
+            try:
+                src_stat = os.lstat(src_file)
+            except OSError:
+                pass  # Reported by the copy attempts below
+        # Size for the status message and link check, from the single stat
+        # (the GUI translates the message template and inserts size_hr)
+        if src_stat is not None:
+            status_msg = "Copying ({size})..."
+            size_hr = human_readable_size(src_stat.st_size)
+            src_is_link = stat.S_ISLNK(src_stat.st_mode)
+        else:
+            status_msg = "Copying..."
+            size_hr = ""
+            src_is_link = False
+
         for attempt in range(retries):
             # Check for pause/cancel before each attempt
             if self.cancel_event.is_set():
                 return False
-            while self.pause_event.is_set():
-                time.sleep(0.5)  # Use a short sleep
+            self.resume_event.wait()  # Blocks while paused
 
             try:
-                dest_dir = os.path.dirname(dest_file)
-                # Ensure directory exists using simpler, robust method (handles race conditions)
-                os.makedirs(dest_dir, exist_ok=True)
-
                 # Emit status just before the potentially blocking copy operation
-                try:
-                    file_size_hr = self._human_readable_size(
-                        os.path.getsize(src_file))
-                    status_msg = f"Copying ({file_size_hr})..."
-                except OSError:  # Ignore error getting size for status update
-                    status_msg = "Copying..."
                 self._emit_progress(
                     'status', item=src_file, message=status_msg,
-                    destination_path=dest_file
+                    size_hr=size_hr, destination_path=dest_file
                 )
 
-                # Copy file and metadata, do not follow source link
-                shutil.copy2(src_file, dest_file, follow_symlinks=False)
+                # Copy file and metadata, do not follow source link. The
+                # destination directory was created when its source directory
+                # was opened (or by _switch_target); only if it has gone
+                # missing since is it created here
+                try:
+                    self._copy_file_data(src_file, dest_file, src_is_link)
+                except FileNotFoundError:
+                    dest_dir = os.path.dirname(dest_file)
+                    if os.path.isdir(dest_dir):
+                        raise  # The source is missing
+                    os.makedirs(dest_dir, exist_ok=True)
+                    self._copy_file_data(src_file, dest_file, src_is_link)
                 return True  # Success
 
             except OSError as e:
                 # Handle common OS errors like permissions or disk full
                 self._emit_log(
                     logging.WARNING,
-                    f"Attempt {attempt+1}/{retries} OS error during copy/makedirs: {e}"
+                    "Attempt %s/%s OS error during copy: %s", attempt + 1, retries, e
                 )
 
             # If attempt failed and more retries are allowed
@@ -277,18 +1046,19 @@ class BackupEngine:
                 # Check again for pause/cancel before sleeping
                 if self.cancel_event.is_set():
                     return False
-                while self.pause_event.is_set():
-                    time.sleep(0.5)
+                self.resume_event.wait()  # Blocks while paused
                 if self.cancel_event.is_set():
                     return False
 
                 self._emit_log(
-                    logging.INFO, f"Retrying copy in {delay} seconds...")
-                time.sleep(delay)
+                    logging.INFO, "Retrying copy in %s seconds...", delay)
+                # Sleep until the delay expires, or stop early on cancellation
+                if self.cancel_event.wait(delay):
+                    return False
             else:
                 # Log final failure after all retries
                 self._emit_log(
-                    logging.ERROR, f"Failed copy after {retries} attempts: {src_file}")
+                    logging.ERROR, "Failed copy after %s attempts: %s", retries, src_file)
                 return False  # Indicate failure
 
         return False  # Should not be reached normally
@@ -306,8 +1076,13 @@ class BackupEngine:
             # state remains default_values
         else:
             try:
-                with open(state_file, 'r', encoding='utf-8') as f:
-                    loaded_data = json.load(f)
+                with open(state_file, 'rb') as f:
+                    raw_state = f.read()
+                if raw_state.startswith(STATE_FILE_MAGIC):
+                    loaded_data = self._decode_resume_state(raw_state)
+                else:
+                    # Legacy JSON state file from older versions
+                    loaded_data = json.loads(raw_state.decode('utf-8'))
                 # Validate keys and types more strictly after loading
                 if (isinstance(loaded_data, dict) and
                         "last_processed" in loaded_data and
@@ -317,54 +1092,133 @@ class BackupEngine:
                         isinstance(loaded_data["target_index_for_last"], int)):
                     state = loaded_data  # Use loaded data only if valid
                     self._emit_log(
-                        logging.INFO, f"Loaded resume state from {state_file}")
+                        logging.INFO, "Loaded resume state from %s", state_file)
                 else:
                     self._emit_log(
                         logging.WARNING,
-                        f"State file {state_file} invalid format/keys. Start fresh."
+                        "State file %s invalid format/keys. Start fresh.", state_file
                     )
                     # state remains default_values
-            # Catch JSON errors and explicit validation errors
-            except ValueError as e:  # Catches JSONDecodeError and type errors
+            # Catch decoding errors and explicit validation errors
+            except (ValueError, struct.error) as e:  # Incl. JSON/Unicode errors
                 self._emit_log(
                     logging.ERROR,
-                    f"Error reading state file {state_file}: {e}. Start fresh."
+                    "Error reading state file %s: %s. Start fresh.", state_file, e
                 )
                 # state remains default_values
             except OSError as e:
                 self._emit_log(
                     logging.ERROR,
-                    f"Error loading state file {state_file}: {e}. Start fresh."
+                    "Error loading state file %s: %s. Start fresh.", state_file, e
                 )
                 # state remains default_values
 
         # Set engine attributes based on final state (loaded or default)
         self.last_processed_path = state["last_processed"]
         self.target_index = state["target_index_for_last"]
+        self._resume_cursor_parts = None
+        if self.last_processed_path is not None:
+            try:
+                relative_cursor = os.path.relpath(
+                    self.last_processed_path, self.source_dir)
+            except ValueError:  # e.g. on another drive (Windows)
+                relative_cursor = os.pardir
+            if relative_cursor == os.curdir or relative_cursor.split(os.sep)[0] == os.pardir:
+                self._emit_log(
+                    logging.WARNING,
+                    "Resume path %s not in source. Start fresh.", self.last_processed_path
+                )
+                self.last_processed_path = None
+            else:
+                self._resume_cursor_parts = tuple(relative_cursor.split(os.sep))
         self.is_resuming = self.last_processed_path is not None
 
-    def _save_resume_state(self):
-        """Save the current resume state (last item, target index) atomically."""
-        state_data = {
-            "last_processed": self.last_processed_path,
-            "target_index_for_last": self.target_index
+    @staticmethod
+    def _decode_resume_state(raw_state: bytes) -> Dict[str, Any]:
+        """
+        Decode a binary resume state record (see _STATE_HEADER).
+
+        Returns:
+            The state as a dict with the same keys as legacy JSON state files.
+
+        Raises:
+            ValueError: If the record is truncated or has an unknown version.
+        """
+        if len(raw_state) < _STATE_HEADER.size:
+            raise ValueError("truncated state header")
+        _magic, version, target_index, path_length = \
+            _STATE_HEADER.unpack_from(raw_state)
+        if version != STATE_FILE_VERSION:
+            raise ValueError(f"unsupported state format version {version}")
+        path_bytes = raw_state[_STATE_HEADER.size:]
+        if len(path_bytes) != path_length:
+            raise ValueError("truncated state path")
+        return {
+            "last_processed": path_bytes.decode('utf-8', 'surrogateescape')
+                              if path_length else None,
+            "target_index_for_last": target_index
         }
-        # Write to a temporary file first, then replace original for atomicity
-        temp_state_file = self.state_file + '.tmp'
-        try:
-            with open(temp_state_file, 'w', encoding='utf-8') as f:
-                # Use indent for readability
-                json.dump(state_data, f, indent=4)
-            # os.replace is atomic on most platforms
-            os.replace(temp_state_file, self.state_file)
-            logging.debug(
-                "Saved state: Last='%s' on idx %d",
-                self.last_processed_path, self.target_index
-            )
-        except Exception as e:  # pylint: disable=broad-except
-            # Log critical error if state cannot be saved, as resume will fail
-            self._emit_log(
-                logging.ERROR, f"CRITICAL: Failed to save resume state: {e}")
+
+    def _save_resume_state(self):
+        """
+        Save the current resume state (last item, target index) atomically.
+
+        Writes synchronously and clears any pending debounced save; safe to
+        call from both the traversal and the state saver thread.
+        """
+        with self._state_lock:
+            self._state_dirty.clear()
+            self._items_since_state_save = 0
+            last_processed_path = self.last_processed_path
+            path_bytes = b'' if last_processed_path is None else \
+                last_processed_path.encode('utf-8', 'surrogateescape')
+            state_data = _STATE_HEADER.pack(
+                STATE_FILE_MAGIC, STATE_FILE_VERSION, self.target_index,
+                len(path_bytes)) + path_bytes
+            # Write to a temporary file first, then replace original for atomicity
+            temp_state_file = self.state_file + '.tmp'
+            try:
+                with open(temp_state_file, 'wb') as f:
+                    f.write(state_data)
+                # os.replace is atomic on most platforms
+                os.replace(temp_state_file, self.state_file)
+                logging.debug(
+                    "Saved state: Last='%s' on idx %d",
+                    last_processed_path, self.target_index
+                )
+            except Exception as e:  # pylint: disable=broad-except
+                # Log critical error if state cannot be saved, as resume will fail
+                self._emit_log(
+                    logging.ERROR, "CRITICAL: Failed to save resume state: %s", e)
+
+    def _state_saver_loop(self):
+        """Background thread body: write the resume state when it changed."""
+        wake = self._state_saver_wake
+        while True:
+            wake.wait(STATE_SAVE_INTERVAL_SECONDS)
+            wake.clear()
+            if self._state_saver_stop.is_set():
+                return
+            if self._state_dirty.is_set():
+                self._save_resume_state()
+
+    def _start_state_saver(self):
+        """Start the background thread saving the resume state periodically."""
+        self._state_saver_stop.clear()
+        self._state_saver_wake.clear()
+        self._state_saver = threading.Thread(
+            target=self._state_saver_loop, name='pybackup-state-saver', daemon=True)
+        self._state_saver.start()
+
+    def _stop_state_saver(self):
+        """Stop the state saver thread and flush any unsaved state change."""
+        if self._state_saver is not None:
+            self._state_saver_stop.set()
+            self._state_saver_wake.set()
+            self._state_saver.join()
+            self._state_saver = None
+        if self._state_dirty.is_set():
+            self._save_resume_state()
 
     def _ensure_target_initialized(self) -> bool:
         """Ensure the current target directory exists and is cleared once per run."""
@@ -376,18 +1230,20 @@ class BackupEngine:
         # Check if we already prepared this target during *this* execution
         if self.current_target_base not in self.targets_initialized_this_run:
             self._emit_log(
-                logging.INFO, f"Preparing target for this run: {self.current_target_base}")
+                logging.INFO, "Preparing target for this run: %s", self.current_target_base)
             # Attempt to clear contents (selectively)
             if not self._clear_target_directory(self.current_target_base):
                 # Error already logged by clear function
                 return False  # Indicate failure to prepare
+            # Clearing freed space: forget any free space probed before
+            self._free_space_cache.pop(self.current_target_base, None)
             # Mark as initialized for this run and reset local stats
             self.targets_initialized_this_run.append(self.current_target_base)
             self.items_processed_this_target = 0
             self.size_copied_this_target = 0
             self.last_item_logged_this_target = "N/A"
             self._emit_log(
-                logging.INFO, f"Target '{self.current_target_base}' prepared.")
+                logging.INFO, "Target '%s' prepared.", self.current_target_base)
         return True  # Indicate success or already initialized this run
 
     def _switch_target(self, current_item_path: str, item_size: int = 0) -> str:
@@ -399,8 +1255,8 @@ class BackupEngine:
         """
         self._emit_log(
             logging.INFO,
-            f"Target '{self.current_target_base}' appears full "
-            f"(checking for {self._human_readable_size(item_size)})."
+            "Target '%s' appears full (checking for %s).",
+            self.current_target_base, human_readable_size(item_size)
         )
         # Emit stats about the target that just filled up
         self._emit_progress(
@@ -411,25 +1267,27 @@ class BackupEngine:
             last_item=self.last_item_logged_this_target
         )
 
-        # Save state *before* changing the target index
-        self._save_resume_state()
-        self.target_index += 1
+        # Save state *before* changing the target index (flushes any pending
+        # debounced save, which must not record the new index for old items)
+        with self._state_lock:
+            self._save_resume_state()
+            self.target_index += 1
 
         # Check if we ran out of target disks
         if self.target_index >= len(self.target_dirs):
             msg = f"Ran out of targets. Cannot process: {current_item_path}"
             self._emit_log(logging.ERROR, msg)
-            self.failed_items.append(
-                (current_item_path, "Ran out of target space"))
+            self._record_failure(current_item_path, "Ran out of target space")
             raise RuntimeError("Ran out of target space")
 
         # Update engine state for the new target
         self.current_target_base = self.target_dirs[self.target_index]
+        self._target_prefix = _dir_prefix(self.current_target_base)
         self.items_processed_this_target = 0
         self.size_copied_this_target = 0
         self.last_item_logged_this_target = "N/A"
         self._emit_log(
-            logging.INFO, f"Switching to next target: {self.current_target_base}")
+            logging.INFO, "Switching to next target: %s", self.current_target_base)
         self._emit_progress(
             'target_switch', index=self.target_index, path=self.current_target_base
         )
@@ -442,63 +1300,146 @@ class BackupEngine:
 
         # Re-check space on the new drive immediately for the current item
         required_margin, current_free = self._get_free_space_margin(
-            self.current_target_base)
+            self.current_target_base, force_probe=True)
         if required_margin > 0 and current_free < item_size + required_margin:
             msg = (
                 f"Insufficient space on NEW target '{self.current_target_base}' "
                 f"for {current_item_path} "
-                f"(Size: {self._human_readable_size(item_size)})."
+                f"(Size: {human_readable_size(item_size)})."
             )
             self._emit_log(logging.ERROR, msg)
-            self.failed_items.append(
-                (current_item_path, "Insufficient space on new target"))
+            self._record_failure(current_item_path, "Insufficient space on new target")
             raise RuntimeError("Insufficient space on new target")
 
-        # Calculate and return the new destination path for the item being processed
+        # Calculate and return the new destination path for the item being
+        # processed, creating its directory on the new target (the remaining
+        # items of the directory are copied there too)
+        destination_path = self._destination_for(current_item_path)
         try:
-            relative_path = os.path.relpath(current_item_path, self.source_dir)
-            return os.path.join(self.current_target_base, relative_path)
-        except ValueError as e:
-            # This should ideally not happen if source_path is always valid
-            msg = f"Path calculation error after switch for {current_item_path}: {e}"
-            self._emit_log(logging.ERROR, msg)
-            self.failed_items.append(
-                (current_item_path, "Path calculation error after switch")
-            )
-            raise RuntimeError(msg) from e
+            os.makedirs(os.path.dirname(destination_path), exist_ok=True)
+        except OSError as e:
+            # Reported again by the copy, which retries creating it
+            self._emit_log(logging.WARNING, "Cannot create dest dir on new target: %s", e)
+        return destination_path
+
+    def _destination_for(self, source_path: str) -> str:
+        """
+        Map a path below source_dir to the same path on the current target.
 
-    def _process_directory_recursive(self, current_source_dir: str):
+        Traversed paths always start with the normalized source prefix, so the
+        relative part is a plain slice (no os.path.relpath/join parsing).
         """
-        Recursively process a directory: clean destination, sync source items.
+        assert source_path.startswith(self._source_dir_prefix), source_path
+        return self._target_prefix + source_path[self._source_dir_prefix_len:]
 
-        This is the core recursive function. It lists source and destination,
-        removes extra items from destination, then iterates through sorted source
-        items, handling subdirectories via recursion and files/links via copy/sync
-        logic, including target switching if space runs out.
+    @staticmethod
+    def _is_ignored_dir(entry: os.DirEntry) -> bool:
+        """Check if a source DirEntry is an ignored system directory."""
+        if entry.name.lower() not in IGNORE_DIRS_ON_CLEAR_LOWER:
+            return False
+        try:
+            return entry.is_dir(follow_symlinks=False)
+        except OSError:
+            return False
+
+    def _list_source_dir(self, path: str, stat_files: bool = False) -> list:
+        """
+        List a source directory (bulk listing if enabled, else os.scandir).
 
         Args:
-            current_source_dir: The absolute path of the source directory currently
-                                being processed.
+            path: The directory to list.
+            stat_files: If True, also take (and cache in the entries) the
+                        lstat of every regular file, which the traversal
+                        needs for its size and mtime checks anyway. Used by
+                        the background listing threads, so those calls are
+                        made ahead of the traversal rather than by it.
+
+        Raises:
+            OSError: If the directory cannot be listed.
         """
-        # Check for cancellation at the start of processing a directory
-        if self.cancel_event.is_set():
-            return
+        entries = _scandir_bulk(path) if self.config['bulk_listing'] else None
+        if entries is None:
+            with os.scandir(path) as it:
+                entries = list(it)
+        if stat_files:
+            for entry in entries:
+                try:
+                    if entry.is_file(follow_symlinks=False):
+                        entry.stat(follow_symlinks=False)
+                except OSError:
+                    pass  # Not cached: the traversal's own call reports the error
+        return entries
+
+    def _prefetch_listings(self, entries: list):
+        """
+        List the subdirectories among entries in the background.
+
+        They are submitted in traversal order, so the listings the traversal
+        needs next are ready first; _open_directory picks them up.
+        """
+        pool = self._listing_pool
+        prefetched = self._prefetched_listings
+        for entry in entries:
+            if len(prefetched) >= LISTING_PREFETCH_MAX:
+                break
+            if entry.is_dir(follow_symlinks=False):
+                prefetched[entry.path] = pool.submit(
+                    self._list_source_dir, entry.path, True)
+
+    def _drop_prefetched_listings(self, source_dir: str, children: bool = False):
+        """
+        Cancel and forget background listings of directories never opened.
+
+        Otherwise they would be listed (and their files stat'ed) for nothing
+        and keep counting against LISTING_PREFETCH_MAX for the rest of the
+        run.
 
+        Args:
+            source_dir: The directory skipped, or with children=True, the
+                        directory whose remaining subdirectories are skipped
+                        (its frame is abandoned).
+            children: Whether to drop the listings below source_dir instead
+                      of the one of source_dir itself.
+        """
+        prefetched = self._prefetched_listings
+        if children:
+            prefix = _dir_prefix(source_dir)
+            paths = [path for path in prefetched if path.startswith(prefix)]
+        else:
+            paths = [source_dir]
+        for path in paths:
+            future = prefetched.pop(path, None)
+            if future is not None:
+                future.cancel()
+
+    def _open_directory(self, current_source_dir: str,
+                        rel_parts: Tuple[str, ...] = ()) -> Optional[Tuple[str, str, Tuple[str, ...], Any, int, Any, Any]]:  # pylint: disable=line-too-long
+        """
+        Open a source directory for processing: list it and clean destination.
+
+        Lists source and destination, removes extra items from destination and
+        sorts the source entries, returning the traversal frame used by
+        _process_tree_iterative.
+
+        Args:
+            current_source_dir: The absolute path of the source directory to open.
+            rel_parts: Path components of current_source_dir relative to the
+                       source root (empty for the root itself).
+
+        Returns:
+            A (source_dir, dest_dir, rel_parts, entries, item_count, dest_listing,
+            run_cursors) frame, where entries yields the sorted (index,
+            DirEntry) pairs of the directory, dest_listing is a (target_index,
+            {name: DirEntry}) pair for the remaining destination items (None if
+            not listed) and run_cursors maps the names of files copied in
+            inode order to their resume cursor path (see
+            _order_file_runs_by_inode; None if none are), or None if the
+            directory cannot be processed (or the backup was cancelled).
+        """
         # Determine corresponding destination directory path based on current target
-        try:
-            relative_dir_path = os.path.relpath(
-                current_source_dir, self.source_dir)
-            # Handle root case where relpath is '.' to avoid joining issues
-            current_dest_dir = self.current_target_base if relative_dir_path == '.' \
-                else os.path.join(self.current_target_base, relative_dir_path)
-        except ValueError as e:
-            # This can happen if current_source_dir somehow isn't under source_dir
-            self._emit_log(
-                logging.ERROR,
-                f"Path calculation error for dir {current_source_dir}: {e}. Skip recursion."
-            )
-            self.failed_items.append((current_source_dir, f"Path error: {e}"))
-            return
+        # (the root maps to the target base itself)
+        current_dest_dir = self.current_target_base if current_source_dir == self.source_dir \
+            else self._destination_for(current_source_dir)
 
         # Emit status update indicating scanning/comparing this directory
         self._emit_progress(
@@ -507,215 +1448,515 @@ class BackupEngine:
         )
 
         # --- List source and destination directories safely ---
+        # scandir returns DirEntry objects whose type information comes from
+        # the directory listing itself, saving per-item stat calls later on.
+        # Bulk listing returns equivalent entries, if enabled and supported.
+        # The listing may already have been taken in the background
+        prefetched = self._prefetched_listings.pop(current_source_dir, None)
         try:
-            source_items_list = os.listdir(current_source_dir)
-            source_items_set = set(source_items_list)
+            source_entries = prefetched.result() if prefetched is not None \
+                else self._list_source_dir(current_source_dir)
+            source_items_set = {entry.name for entry in source_entries}
         except OSError as e:
             # Log error and stop processing this directory if source is unreadable
             self._emit_log(
-                logging.ERROR, f"Cannot list source dir {current_source_dir}: {e}")
-            self.failed_items.append(
-                (current_source_dir, f"Cannot list source: {e}"))
-            return
+                logging.ERROR, "Cannot list source dir %s: %s", current_source_dir, e)
+            self._record_failure(current_source_dir, f"Cannot list source: {e}")
+            return None
 
         try:
             # Ensure destination directory exists before listing its contents
-            os.makedirs(current_dest_dir, exist_ok=True)
-            dest_items_set = set(os.listdir(current_dest_dir))
+            # (subdirectories are created by the traversal just before they
+            # are opened)
+            if not rel_parts:
+                os.makedirs(current_dest_dir, exist_ok=True)
+            if rel_parts and self.current_target_base in self._fully_cleared_targets:
+                # The target was fully cleared when first used in this run
+                # (only ignored system directories remain, which the
+                # traversal skips) and every source path is visited once, so
+                # below its root nothing can be there yet: no listing,
+                # cleanup or comparison needed. After a partial clear, the
+                # leftovers are listed and handled like any destination.
+                dest_entries = {}
+            else:
+                with os.scandir(current_dest_dir) as it:
+                    dest_entries = {entry.name: entry for entry in it}
         except (OSError, ValueError, RuntimeError) as e:
             # If destination cannot be listed/created, log warning and skip cleanup
             self._emit_log(
                 logging.WARNING,
-                f"Cannot list/create dest dir {current_dest_dir}: {e}. Cleanup skipped."
+                "Cannot list/create dest dir %s: %s. Cleanup skipped.", current_dest_dir, e
             )
-            dest_items_set = set()  # Assume empty destination if listing fails
+            dest_entries = None  # Assume empty destination if listing fails
 
         # --- Cleanup Destination: Remove extra items not in source ---
-        items_to_delete = dest_items_set - source_items_set
-        # Filter out system/hidden directories that should not be deleted
-        items_to_delete = {item for item in items_to_delete
-                           if item.lower() not in IGNORE_DIRS_ON_CLEAR_LOWER}
-
-        for item_name in items_to_delete:
+        # Built in a single pass, skipping system/hidden directories that
+        # should not be deleted and trash directories still being deleted in
+        # the background
+        items_to_delete = [
+            dest_entry for dest_entry in (dest_entries or {}).values()
+            if dest_entry.name not in source_items_set
+            and dest_entry.name.lower() not in IGNORE_DIRS_ON_CLEAR_LOWER
+            and not dest_entry.name.startswith(TRASH_DIR_PREFIX)
+        ]
+
+        for dest_entry in items_to_delete:
             # Check cancellation frequently during potentially long cleanup
             if self.cancel_event.is_set():
-                return
+                return None
             # Allow pausing during cleanup phase as well
-            while self.pause_event.is_set():
-                time.sleep(0.5)
+            self.resume_event.wait()  # Blocks while paused
 
-            item_path_dest = os.path.join(current_dest_dir, item_name)
+            item_path_dest = dest_entry.path
             self._emit_progress(
                 'status', current_dir=current_source_dir, item=item_path_dest,
                 message="Deleting...", destination_path=item_path_dest
             )
             try:
-                # Remove item based on type
-                if os.path.islink(item_path_dest) or os.path.isfile(item_path_dest):
+                # Remove item based on its type, cached by the listing
+                if dest_entry.is_symlink() or dest_entry.is_file():
                     os.remove(item_path_dest)
-                elif os.path.isdir(item_path_dest):
-                    # Use shutil.rmtree for directories
-                    shutil.rmtree(item_path_dest)
+                elif dest_entry.is_dir():
+                    # Delete directory trees in a single bottom-up pass
+                    self._fast_rmtree(item_path_dest)
                 self._emit_log(
-                    logging.INFO, f"Deleted extra item: {item_path_dest}")
+                    logging.INFO, "Deleted extra item: %s", item_path_dest)
             except (OSError, ValueError) as e:
                 # Log failure but continue cleanup for other items
                 self._emit_log(logging.WARNING,
-                               f"Failed delete: {item_path_dest} ({e})")
-                self.failed_items.append(
-                    (item_path_dest, f"Failed delete: {e}"))
+                               "Failed delete: %s (%s)", item_path_dest, e)
+                self._record_failure(item_path_dest, f"Failed delete: {e}")
+
+        # --- Prune and Sort Source Items ---
+        # Ignored system directories (recycle bin, volume info...) are dropped
+        # from the listing in place, like pruning dirs[:] in an os.walk loop,
+        # so they are never descended into nor counted as items of this dir
+        source_entries[:] = [entry for entry in source_entries
+                             if not self._is_ignored_dir(entry)]
+        # Ensure consistent order within directory (plain code point order of
+        # the names, which the resume cursor relies on; the key runs in C)
+        source_entries.sort(key=_ENTRY_NAME)
+        run_cursors = self._order_file_runs_by_inode(source_entries) \
+            if self._inode_order else None
+        # Overlap listing the subdirectories with copying this directory's
+        # files (not while resuming: most of them are skipped unopened)
+        if self._listing_pool is not None and not self.is_resuming:
+            self._prefetch_listings(source_entries)
+        # The destination listing stays valid for skip checks while items of
+        # this directory are copied to the same target
+        dest_listing = None if dest_entries is None else (self.target_index, dest_entries)
+        return (current_source_dir, current_dest_dir, rel_parts,
+                enumerate(source_entries), len(source_entries), dest_listing,
+                run_cursors)
+
+    @staticmethod
+    def _order_file_runs_by_inode(entries: list) -> Optional[Dict[str, Optional[str]]]:
+        """
+        Reorder each run of consecutive regular files in entries by inode.
 
-        # --- Process Source Items (Sorted within this directory) ---
-        source_items_list.sort()  # Ensure consistent order within directory
-        items_in_dir = len(source_items_list)
+        On rotational disks, reading files in inode order rather than name
+        order saves head seeks. Directories and links keep their name order
+        position, and so does every run as a whole, so the resume cursor and
+        its name comparisons stay valid as long as it only moves past a run
+        once all of its files are done: the returned mapping gives, per file
+        name in a reordered run, the path to record as processed (the run's
+        last name, for the file processed last) or None (cursor unchanged).
 
-        for i, item_name in enumerate(source_items_list):
-            # Check cancellation and pause frequently
-            if self.cancel_event.is_set():
-                return
-            while self.pause_event.is_set():
-                time.sleep(0.5)
+        Args:
+            entries: Name-sorted directory entries, reordered in place.
 
-            source_path = os.path.join(current_source_dir, item_name)
+        Returns:
+            The name -> cursor path mapping, or None if nothing was reordered.
+        """
+        def is_regular(entry) -> bool:
+            try:
+                return entry.is_file(follow_symlinks=False)
+            except OSError:
+                return False
 
-            # --- Resume Check: Skip items already processed in previous runs ---
-            if self.is_resuming and self.last_processed_path and source_path <= self.last_processed_path:  # pylint: disable=line-too-long
-                logging.debug("Skipping (resume check): %s <= %s",
-                              source_path, self.last_processed_path)
+        run_cursors = {}
+        count = len(entries)
+        start = 0
+        while start < count:
+            if not is_regular(entries[start]):
+                start += 1
+                continue
+            end = start + 1
+            while end < count and is_regular(entries[end]):
+                end += 1
+            if end - start > 1:
+                last_name_path = entries[end - 1].path
+                run = entries[start:end]
+                run.sort(key=_ENTRY_INODE)
+                entries[start:end] = run
+                for entry in run:
+                    run_cursors[entry.name] = None
+                run_cursors[run[-1].name] = last_name_path
+            start = end
+        return run_cursors or None
+
+    def _record_failure(self, path: str, reason: str):
+        """
+        Record an item that could not be processed.
+
+        The failure is kept in failed_items (the last FAILED_ITEMS_TAIL only)
+        and appended to failures_file, which is truncated by the first
+        failure of each run.
+        """
+        self.failed_items.append((path, reason))
+        self.failed_count += 1
+        if self._failures_out is False:
+            return  # The failures file could not be written earlier
+        try:
+            if self._failures_out is None:
+                self._failures_out = open(self.failures_file, 'w', encoding='utf-8')
+            self._failures_out.write(json.dumps({'path': path, 'reason': reason}) + '\n')
+        except (OSError, ValueError) as e:
+            self._failures_out = False
+            self._emit_log(logging.WARNING, "Cannot write failures file %s: %s",
+                           self.failures_file, e)
+
+    def _final_failure_fields(self) -> Dict[str, Any]:
+        """Failure details sent with the done/cancelled/error progress message."""
+        fields = {'failed_items': list(self.failed_items),
+                  'failed_count': self.failed_count}
+        if self.failed_count:
+            fields['failures_file'] = self.failures_file
+        return fields
+
+    def _finish_item(self, source_path: str, destination_path: str,
+                     operation_successful: bool, cursor_path: Optional[str]):
+        """
+        Record the outcome of a processed item and notify the GUI.
+
+        On success, the resume cursor moves to cursor_path (normally
+        source_path; None leaves it unchanged, see _order_file_runs_by_inode).
+        """
+        # Update overall processed count and save state ONLY on success
+        if operation_successful:
+            self.total_items_processed_this_run += 1
+            if cursor_path is not None:
+                self.last_processed_path = cursor_path  # Update last successful path
+                self._state_dirty.set()  # Saved in the background (with target_index)
+                self._items_since_state_save += 1
+                if self._items_since_state_save >= STATE_SAVE_MAX_ITEMS:
+                    self._state_saver_wake.set()
+            # Send cumulative stats for this run to GUI
+            self._emit_progress(
+                'progress_update',
+                items_processed=self.total_items_processed_this_run,
+                size_copied=self.total_size_copied_this_run
+            )
+
+        # Signal item completion regardless of success for UI update
+        self._emit_progress(
+            'item_done', source_path=source_path,
+            destination_path=destination_path, success=operation_successful
+        )
+
+    def _retire_copies(self, pending: collections.deque, wait: bool = False,
+                       max_pending: Optional[int] = None):
+        """
+        Finish submitted file copies in submission (i.e. traversal) order.
+
+        Only the leading run of completed copies is retired, so the resume
+        state always advances monotonically, even though copies may complete
+        out of order.
+
+        Args:
+            pending: Deque of (source_path, destination_path, file_size, future,
+                     cursor_path) tuples, oldest first. Retired entries are
+                     removed.
+            wait: If True, block until all pending copies are retired.
+            max_pending: If given, block until at most this many copies are
+                         pending (oldest first), bounding the copies in flight.
+        """
+        while pending:
+            source_path, destination_path, file_size, future, cursor_path = pending[0]
+            if not (wait or future.done() or
+                    (max_pending is not None and len(pending) > max_pending)):
+                break
+            pending.popleft()
+            self._inflight_bytes -= file_size
+            if not future.done():
+                # About to block: keep the GUI up to date meanwhile
+                self._flush_progress()
+                while not wait_futures((future,), PROGRESS_BATCH_INTERVAL_NS / 1e9)[0]:
+                    self._flush_progress()
+            operation_successful = future.result()
+            if operation_successful:
+                # Update statistics on successful copy
+                self.items_processed_this_target += 1
+                self.size_copied_this_target += file_size
+                self.total_size_copied_this_run += file_size
+                self.last_item_logged_this_target = source_path
+                self._record_bytes_written(self.current_target_base, file_size)
+            else:
+                # Add to failed items if copy failed after retries
+                self._record_failure(source_path, "Copy failed")
+            self._finish_item(source_path, destination_path, operation_successful,
+                              cursor_path)
+
+    def _process_tree_iterative(self, root_source_dir: str):
+        """
+        Process the source tree: clean destinations, sync source items.
+
+        This is the core traversal loop. Instead of recursing, it keeps an
+        explicit stack with one frame per open directory (see _open_directory)
+        and handles one source item per iteration: subdirectories push a new
+        frame, files/links go through copy/sync logic, including target
+        switching if space runs out. Items are visited in the same depth-first,
+        name-sorted order as a recursive walk, which the resume state relies on.
+
+        File data is copied by the run's pool of 'copy_workers' threads
+        (self._copy_pool), overlapping the copies of consecutive files of a
+        directory. Everything else
+        (cleanup, directories, links, target switching) stays on this thread,
+        and pending copies are drained before any of it can depend on them.
+
+        Args:
+            root_source_dir: The absolute path of the source directory to start
+                             from.
+        """
+        pending = collections.deque()
+        try:
+            self._walk_tree(root_source_dir, self._copy_pool, pending)
+        finally:
+            # Copies already submitted always complete (they stop early on
+            # cancel); retire them so their results are recorded in order
+            self._retire_copies(pending, wait=True)
+
+    def _walk_tree(self, root_source_dir: str, copy_pool: ThreadPoolExecutor,
+                   pending: collections.deque):
+        """Traversal loop of _process_tree_iterative (see there)."""
+        # This loop runs once per source item: bind the bound methods and
+        # globals it uses to locals (LOAD_FAST instead of attribute lookups).
+        # None of them change when the target is switched.
+        cancel_is_set = self.cancel_event.is_set
+        wait_while_paused = self.resume_event.wait
+        is_running = self.resume_event.is_set
+        emit_progress = self._emit_progress
+        retire_copies = self._retire_copies
+        finish_item = self._finish_item
+        destination_for = self._destination_for
+        open_directory = self._open_directory
+        submit_copy = copy_pool.submit
+        copy_file = self._copy_file_with_retry
+        add_pending = pending.append
+        # Leave room for the copy about to be submitted
+        max_pending_copies = self._copy_workers * COPY_QUEUE_DEPTH_PER_WORKER - 1
+
+        stack = collections.deque()
+        root_frame = open_directory(root_source_dir)
+        if root_frame is not None:
+            stack.append(root_frame)
+
+        while stack:
+            # Single cancellation and pause check point for the whole traversal
+            if cancel_is_set():
+                break
+            if not is_running():
+                self._flush_progress()
+                wait_while_paused()  # Blocks while paused
+
+            (current_source_dir, current_dest_dir, rel_parts,
+             entries, items_in_dir, dest_listing, run_cursors) = stack[-1]
+            next_entry = next(entries, None)
+            if next_entry is None:
+                # --- Finished processing items in current_source_dir ---
+                retire_copies(pending, wait=True)
+                stack.pop()
+                emit_progress(
+                    'status', current_dir=current_source_dir, message="Directory done.",
+                    destination_path=current_dest_dir
+                )
+                if stack:
+                    # Signal completion of the directory item in its parent
+                    emit_progress(
+                        'item_done', source_path=current_source_dir,
+                        destination_path=current_dest_dir, success=False
+                    )
                 continue
-            # Stop initial resume skipping mode after passing the resume point
+            i, entry = next_entry
+
+            source_path = entry.path
+            # Path recorded as processed when this item succeeds (None: the
+            # item is in a run of files copied in inode order, not the last)
+            cursor_path = source_path if run_cursors is None else \
+                run_cursors.get(entry.name, source_path)
+
+            # Determine item type safely from the cached DirEntry data
+            try:
+                is_link = entry.is_symlink()
+                # Checks must not follow links to avoid double processing
+                is_dir = entry.is_dir(follow_symlinks=False)
+                is_file = entry.is_file(follow_symlinks=False)
+            except OSError:
+                # Type could not be determined; handled as unknown below
+                is_link = is_dir = is_file = False
+
+            # --- Resume Check: Skip items already processed in previous runs ---
+            # Only done until the resume point is passed; once is_resuming is
+            # cleared, no item is compared against the cursor again
             if self.is_resuming:
-                self._emit_log(
-                    logging.INFO, f"Resume point reached. Processing from: {source_path}")
-                self.is_resuming = False  # Now process items normally
+                cursor_parts = self._resume_cursor_parts
+                entry_parts = rel_parts + (entry.name,)
+                if entry_parts <= cursor_parts:
+                    # Before or at the cursor: skip, without even listing skipped
+                    # dirs, unless this is a directory containing the cursor
+                    if not (is_dir and cursor_parts[:len(entry_parts)] == entry_parts
+                            and entry_parts != cursor_parts):
+                        logging.debug("Skipping (resume check): %s <= %s",
+                                      source_path, self.last_processed_path)
+                        continue
+                else:
+                    # Stop resume skipping mode after passing the resume point
+                    self._emit_log(
+                        logging.INFO, "Resume point reached. Processing from: %s", source_path)
+                    self.is_resuming = False  # Now process items normally
 
             # Calculate destination path based on *current* target base
             # Must recalculate here as target might have switched while processing previous file
-            try:
-                relative_path = os.path.relpath(source_path, self.source_dir)
-                destination_path = os.path.join(
-                    self.current_target_base, relative_path)
-            except ValueError as e:
-                self._emit_log(
-                    logging.ERROR, f"Path error {source_path}: {e}. Skip.")
-                self.failed_items.append((source_path, f"Path error: {e}"))
-                continue
+            destination_path = destination_for(source_path)
 
             # Signal start of processing this item
-            self._emit_progress(
+            emit_progress(
                 'item_start', source_path=source_path,
                 destination_path=destination_path, item_index=i,
                 total_items_in_dir=items_in_dir
             )
-
-            # Determine item type safely
-            is_link = os.path.islink(source_path)
-            # isdir/isfile checks should exclude links to avoid double processing
-            is_dir = os.path.isdir(source_path) and not is_link
-            is_file = os.path.isfile(source_path) and not is_link
             operation_successful = False  # Track success for state saving
 
+            if is_file:
+                # Record copies that completed meanwhile; wait only if the
+                # submission queue is full (keeps memory and state lag bounded)
+                retire_copies(pending, max_pending=max_pending_copies)
+            else:
+                # Directories and links are processed in order after all
+                # pending copies, keeping the resume state monotonic
+                retire_copies(pending, wait=True)
+
             # --- Process Based on Type ---
             if is_dir:
-                self._emit_progress(
+                emit_progress(
                     'status', current_dir=current_source_dir, item=source_path,
                     message="Entering dir...", destination_path=destination_path
                 )
+                child_frame = None
                 try:
-                    # Ensure destination directory exists before recursing
-                    os.makedirs(destination_path, exist_ok=True)
-                    # Recursively process the subdirectory
-                    self._process_directory_recursive(source_path)
+                    # Ensure destination directory exists before descending
+                    # (its parent is the directory being processed)
+                    _make_dest_dir(destination_path)
+                    child_frame = open_directory(
+                        source_path, rel_parts + (entry.name,))
                     # Note: Directory structure creation itself doesn't update state/counts
                 except (OSError, ValueError) as e:
-                    # Log errors creating or processing subdirectory
+                    # Log errors creating or opening subdirectory
                     self._emit_log(
-                        logging.ERROR, f"Cannot create/process dir {destination_path}: {e}")
-                    self.failed_items.append((source_path, f"Dir fail: {e}"))
+                        logging.ERROR, "Cannot create/process dir %s: %s", destination_path, e)
+                    self._record_failure(source_path, f"Dir fail: {e}")
+                    # Not opened (if _make_dest_dir failed): drop its listing
+                    self._drop_prefetched_listings(source_path)
+                if child_frame is not None:
+                    # Descend; item_done for this directory is sent when its
+                    # frame is finished and popped from the stack
+                    stack.append(child_frame)
+                    continue
 
             elif is_link:
-                self._emit_progress(
+                emit_progress(
                     'status', current_dir=current_source_dir, item=source_path,
                     message="Processing link...", destination_path=destination_path
                 )
                 process_link = True
+                # A single lstat (or the destination listing, if current)
+                # tells whether anything exists at the destination and if it
+                # is a link, a directory or a file
+                try:
+                    if dest_listing is not None and dest_listing[0] == self.target_index:
+                        dest_entry = dest_listing[1].get(entry.name)
+                        dest_mode = None if dest_entry is None else \
+                            dest_entry.stat(follow_symlinks=False).st_mode
+                    else:
+                        dest_st = _lstat_or_none(destination_path)
+                        dest_mode = None if dest_st is None else dest_st.st_mode
+                except OSError:
+                    dest_mode = None  # Nothing there (or not accessible): create
                 # Check if destination link already exists (simple check)
-                if os.path.islink(destination_path):
-                    try:
-                        # Could add readlink comparison here for more robustness if needed
-                        self._emit_log(
-                            logging.INFO, f"Dest link exists, skip create: {destination_path}")
-                        process_link = False
-                    except (OSError, ValueError) as e:
-                        self._emit_log(
-                            logging.WARNING, f"Error check dest link {destination_path}: {e}. Will try create.")  # pylint: disable=line-too-long
+                if dest_mode is not None and stat.S_ISLNK(dest_mode):
+                    # Could add readlink comparison here for more robustness if needed
+                    self._emit_log(
+                        logging.INFO, "Dest link exists, skip create: %s", destination_path)
+                    process_link = False
 
                 if process_link:
                     try:
                         link_target = os.readlink(source_path)
-                        # Check if link target is a directory to pass hint to os.symlink
-                        target_is_dir_hint = os.path.isdir(source_path)
-                        # Ensure parent directory exists
-                        os.makedirs(os.path.dirname(
-                            destination_path), exist_ok=True)
+                        # Only Windows needs to know if the link points to a
+                        # directory (POSIX ignores the hint); the entry resolves
+                        # the link from its own directory, broken links give False
+                        target_is_dir_hint = os.name == 'nt' and entry.is_dir()
                         # Remove existing non-link item at destination if necessary
-                        if os.path.exists(destination_path) and not os.path.islink(destination_path):  # pylint: disable=line-too-long
+                        if dest_mode is not None:
                             self._emit_log(
-                                logging.WARNING, f"Removing non-link at {destination_path} pre-link.")  # pylint: disable=line-too-long
-                            if os.path.isfile(destination_path):
+                                logging.WARNING, "Removing non-link at %s pre-link.",
+                                destination_path)
+                            if stat.S_ISDIR(dest_mode):
+                                self._fast_rmtree(destination_path)
+                            else:
                                 os.remove(destination_path)
-                            elif os.path.isdir(destination_path):
-                                shutil.rmtree(destination_path)
                         # Create the symbolic link
                         os.symlink(link_target, destination_path,
                                    target_is_directory=target_is_dir_hint)
                         self._emit_log(
-                            logging.INFO, f"Created symlink: {destination_path} -> {link_target}")
+                            logging.INFO, "Created symlink: %s -> %s",
+                            destination_path, link_target)
                         operation_successful = True  # Mark for state save
                     except (OSError, ValueError) as e:
                         # Catch OSError (permissions, FS support) and other errors
                         self._emit_log(logging.WARNING,
-                                       f"Symlink fail: {e}. Skip.")
-                        self.failed_items.append(
-                            (source_path, f"Symlink fail: {e}"))
+                                       "Symlink fail: %s. Skip.", e)
+                        self._record_failure(source_path, f"Symlink fail: {e}")
 
             elif is_file:
                 # Initial status update before size check
-                self._emit_progress(
+                emit_progress(
                     'status', current_dir=current_source_dir, item=source_path,
                     message="Processing file...", destination_path=destination_path
                 )
                 process_file = True
                 try:
-                    file_size = os.path.getsize(source_path)
+                    # Stat once; size and mtime are reused below and by the copy
+                    src_stat = entry.stat(follow_symlinks=False)
+                    file_size = src_stat.st_size
                 except OSError as e:
                     self._emit_log(
-                        logging.ERROR, f"Size error: {source_path}: {e}")
-                    self.failed_items.append((source_path, f"Size error: {e}"))
+                        logging.ERROR, "Size error: %s: %s", source_path, e)
+                    self._record_failure(source_path, f"Size error: {e}")
                     continue  # Skip this file
 
                 # Check if destination exists and matches source (size/mtime)
-                if os.path.exists(destination_path) and not os.path.islink(destination_path):
-                    try:
-                        dest_stat = os.stat(destination_path)
-                        source_mtime = int(os.path.getmtime(source_path))
-                        # Skip if size matches and source is not newer
-                        if file_size == dest_stat.st_size and source_mtime <= int(dest_stat.st_mtime):  # pylint: disable=line-too-long
-                            self._emit_log(
-                                logging.INFO, f"Skip matching file: {destination_path}")
-                            process_file = False
-                        else:
-                            self._emit_log(
-                                logging.WARNING, f"Dest differs: {destination_path}. Overwrite.")
-                    except (OSError, ValueError) as e:
-                        # If metadata comparison fails, assume copy is needed
-                        self._emit_log(logging.WARNING,
-                                       f"Meta compare error: {e}. Will copy.")
+                # (from the directory listing, if taken on the current target)
+                dest_entries = dest_listing[1] if dest_listing is not None and \
+                    dest_listing[0] == self.target_index else None
+                if process_file and not self._needs_copy(src_stat, destination_path,
+                                                         dest_entries):
+                    process_file = False
 
                 if process_file:
-                    # Check Disk Space before attempting copy
+                    # Check Disk Space before attempting copy; copies still in
+                    # flight have not been written yet and are counted as used
                     required_margin, current_free = self._get_free_space_margin(
                         self.current_target_base)
+                    if (required_margin > 0 and
+                            current_free - self._inflight_bytes < file_size + required_margin):
+                        # Looks full: let the pending copies land and cleared items
+                        # be deleted, then check the real space with a fresh probe
+                        # before switching
+                        retire_copies(pending, wait=True)
+                        self._wait_for_trash(self.current_target_base)
+                        required_margin, current_free = self._get_free_space_margin(
+                            self.current_target_base, force_probe=True)
                     # If file doesn't fit (considering margin), switch target
                     if required_margin > 0 and current_free < file_size + required_margin:
                         try:
@@ -726,50 +1967,29 @@ class BackupEngine:
                             # (Handled within _copy_file_with_retry's status emit now)
                         except RuntimeError:
                             # Fatal error during switch (e.g., out of all disks)
-                            # Exception logged by _switch_target, just stop processing this dir
-                            return
-
-                    # Copy the file using the (potentially updated) destination path
-                    if self._copy_file_with_retry(source_path, destination_path):
-                        # Update statistics on successful copy
-                        self.items_processed_this_target += 1
-                        self.size_copied_this_target += file_size
-                        self.total_size_copied_this_run += file_size
-                        self.last_item_logged_this_target = source_path
-                        operation_successful = True  # Mark for state save
-                    else:
-                        # Add to failed items if copy failed after retries
-                        self.failed_items.append((source_path, "Copy failed"))
+                            # Exception logged by _switch_target, just stop processing
+                            # this dir: exhaust its frame so it is popped next
+                            stack[-1] = (current_source_dir, current_dest_dir,
+                                         rel_parts, iter(()), items_in_dir, None, None)
+                            self._drop_prefetched_listings(
+                                current_source_dir, children=True)
+                            continue
+
+                    # Copy the file using the (potentially updated) destination
+                    # path; the item is finished by _retire_copies
+                    future = submit_copy(copy_file, source_path, destination_path, src_stat)
+                    add_pending((source_path, destination_path, file_size, future,
+                                 cursor_path))
+                    self._inflight_bytes += file_size
+                    continue
 
             else:  # Item is not a dir, link, or file
-                self._emit_log(logging.warning,
-                               f"Skip unknown type: {source_path}")
-                self.failed_items.append((source_path, "Unknown type"))
+                self._emit_log(logging.WARNING,
+                               "Skip unknown type: %s", source_path)
+                self._record_failure(source_path, "Unknown type")
 
             # --- Post-Processing for this Item ---
-            # Update overall processed count and save state ONLY on success
-            if operation_successful:
-                self.total_items_processed_this_run += 1
-                self.last_processed_path = source_path  # Update last successful path
-                self._save_resume_state()  # Save state includes current target_index
-                # Send cumulative stats for this run to GUI
-                self._emit_progress(
-                    'progress_update',
-                    items_processed=self.total_items_processed_this_run,
-                    size_copied=self.total_size_copied_this_run
-                )
-
-            # Signal item completion regardless of success for UI update
-            self._emit_progress(
-                'item_done', source_path=source_path,
-                destination_path=destination_path, success=operation_successful
-            )
-
-        # --- Finished processing items in current_source_dir ---
-        self._emit_progress(
-            'status', current_dir=current_source_dir, message="Directory done.",
-            destination_path=current_dest_dir
-        )
+            finish_item(source_path, destination_path, operation_successful, cursor_path)
 
     def run_backup(self):
         """Main entry point to start the backup process for this engine."""
@@ -777,6 +1997,14 @@ class BackupEngine:
         try:
             # Load initial state which sets target_index, last_processed_path
             self._load_resume_state()
+            # Failures of an earlier run must not be mistaken for this run's
+            try:
+                os.remove(self.failures_file)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                self._emit_log(logging.WARNING, "Cannot remove old failures file %s: %s",
+                               self.failures_file, e)
 
             # Validate target index right after load
             if not self.target_dirs:
@@ -786,7 +2014,7 @@ class BackupEngine:
                 # If index from state file is invalid, reset to 0 and clear state
                 self._emit_log(
                     logging.WARNING,
-                    f"Invalid target index {self.target_index} from state. Resetting to 0."
+                    "Invalid target index %s from state. Resetting to 0.", self.target_index
                 )
                 self.target_index = 0
                 self.last_processed_path = None  # Force re-check from start
@@ -795,14 +2023,29 @@ class BackupEngine:
 
             # Set initial target base based on loaded/validated index
             self.current_target_base = self.target_dirs[self.target_index]
+            self._target_prefix = _dir_prefix(self.current_target_base)
 
             # Prepare the initial target directory (clear if needed)
             if not self._ensure_target_initialized():
                 raise RuntimeError(
                     "Failed to initialize first target directory.")
 
-            # Start the recursive processing from the root source directory
-            self._process_directory_recursive(self.source_dir)
+            # Start processing from the root source directory
+            self._inode_order = bool(self.config['inode_order']) and \
+                _is_rotational(self.source_dir)
+            if self._inode_order:
+                self._emit_log(logging.INFO,
+                               "Source is on a rotational disk: copying files in inode order.")
+            self._start_state_saver()
+            self._copy_pool = ThreadPoolExecutor(
+                max_workers=self._copy_workers, thread_name_prefix='pybackup-copy')
+            self._listing_pool = ThreadPoolExecutor(
+                max_workers=LISTING_PREFETCH_WORKERS, thread_name_prefix='pybackup-list')
+            self._process_tree_iterative(self.source_dir)
+            # Make sure the final state is on disk and cleared items are gone
+            # before reporting the outcome
+            self._stop_state_saver()
+            self._wait_for_trash()
 
             # Check cancellation flag after recursion naturally finishes or is interrupted
             if self.cancel_event.is_set():
@@ -811,7 +2054,7 @@ class BackupEngine:
                     'cancelled',
                     total_items=self.total_items_processed_this_run,
                     total_size=self.total_size_copied_this_run,
-                    failed_items=self.failed_items
+                    **self._final_failure_fields()
                 )
             else:
                 # Signal normal completion if not cancelled
@@ -823,21 +2066,38 @@ class BackupEngine:
                     'done',
                     total_items=self.total_items_processed_this_run,
                     total_size=self.total_size_copied_this_run,
-                    failed_items=self.failed_items
+                    **self._final_failure_fields()
                 )
 
         except RuntimeError as e:
             # Handle fatal errors raised explicitly (out of space, init fail, etc.)
-            self._emit_log(logging.ERROR, f"Backup aborted: {e}")
-            self._emit_progress('error', message=str(
-                e), failed_items=self.failed_items)
+            self._emit_log(logging.ERROR, "Backup aborted: %s", e)
+            self._emit_progress('error', message=str(e), **self._final_failure_fields())
         except Exception as e:  # pylint: disable=broad-except
             # Handle unexpected errors during the process
             self._emit_log(
-                logging.ERROR, f"Unexpected error during backup: {e}", exc_info=True)
+                logging.ERROR, "Unexpected error during backup: %s", e, exc_info=True)
             self._emit_progress(
-                'error', message=f"Unexpected error: {e}", failed_items=self.failed_items)
+                'error', message=f"Unexpected error: {e}", **self._final_failure_fields())
         finally:
+            # Release the copy workers (all copies were retired by now)
+            if self._copy_pool is not None:
+                self._copy_pool.shutdown(wait=True)
+                self._copy_pool = None
+            # Drop listings taken for directories that were never opened
+            # (e.g. when cancelled)
+            if self._listing_pool is not None:
+                for future in self._prefetched_listings.values():
+                    future.cancel()
+                self._prefetched_listings.clear()
+                self._listing_pool.shutdown(wait=True)
+                self._listing_pool = None
+            # Flush the resume state and progress also if the backup was aborted
+            self._stop_state_saver()
+            self._flush_progress()
+            if self._failures_out:
+                self._failures_out.close()
+                self._failures_out = None
             # Always signal engine stop
             self._emit_log(logging.INFO, "Backup engine stopped.")
 
@@ -846,8 +2106,9 @@ class BackupEngine:
 
 def start_backup_session(source_dir: str, target_dirs: List[str],
                          config: Dict[str, Any], state_file: str,
-                         progress_queue: queue.Queue, log_queue: queue.Queue,
-                         pause_event: threading.Event, cancel_event: threading.Event):
+                         progress_queue: queue.SimpleQueue,
+                         log_queue: collections.deque,
+                         resume_event: threading.Event, cancel_event: threading.Event):
     """
     Wrapper function to create and run the BackupEngine instance.
     Intended to be the target of the worker thread created by the GUI.
@@ -858,14 +2119,14 @@ def start_backup_session(source_dir: str, target_dirs: List[str],
         config: Dictionary with configuration options ('free_percent', etc.).
         state_file: Path to the resume state file.
         progress_queue: Queue for progress updates to the GUI.
-        log_queue: Queue for log messages to the GUI.
-        pause_event: Event for pausing the process.
+        log_queue: Deque for log messages to the GUI.
+        resume_event: Event cleared to pause the process (set to run).
         cancel_event: Event for cancelling the process.
     """
     engine = BackupEngine(
         source_dir=source_dir, target_dirs=target_dirs, config=config,
         progress_queue=progress_queue, log_queue=log_queue,
-        pause_event=pause_event, cancel_event=cancel_event,
+        resume_event=resume_event, cancel_event=cancel_event,
         state_file=state_file
     )
     engine.run_backup()
@@ -9,16 +9,21 @@ Includes internationalization support via gettext.
 """
 
 # Standard library imports
+import collections
 import gettext
 import locale
 import logging
+import logging.handlers
 import os
 import queue
+import stat
 import sys
 import threading
+import time
 import tkinter as tk
+from concurrent.futures import Future
 from tkinter import ttk, filedialog, messagebox, scrolledtext, font
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Set, Tuple
 
 # Local application imports
 try:
@@ -62,12 +67,39 @@ except (locale.Error, IndexError, ValueError, TypeError) as e:
           file=sys.stderr)
     # languages remains ['en']
 
+# Module logger, looked up once (records still go to the root handlers)
+logger = logging.getLogger(__name__)
+# Logger for the GUI's own events of a run (started, paused...); besides the
+# root handlers, its records are shown in the progress page log view
+gui_event_logger = logging.getLogger(__name__ + '.events')
+# Log record layout (with the full date and time, as the log files of
+# several runs are kept)
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+# Bytes buffered before the run's log file is written (warnings, errors and
+# the end of the run write them out immediately)
+LOG_FILE_BUFFER_BYTES = 64 * 1024
+# A log file is rotated when it reaches this size; the previous files are
+# kept as <log file>.1 ... .<count> (each run also starts a new file)
+LOG_FILE_MAX_BYTES = 16 * 1024 * 1024
+LOG_FILE_BACKUP_COUNT = 3
+
 # Use basicConfig for initial logging setup before GUI possibly reconfigures it
 # This ensures messages during i18n setup are logged somewhere.
-logging.basicConfig(level=logging.INFO,
-                    format='%(asctime)s - %(levelname)s - %(message)s') # NOSONAR
-
-logging.info("Attempting language: %s. Locale dir: %s", languages, LOCALE_DIR)
+logging.basicConfig(level=logging.INFO, format=LOG_FORMAT) # NOSONAR
+
+logger.info("Attempting language: %s. Locale dir: %s", languages, LOCALE_DIR)
+
+# gettext only ever loads compiled catalogs; a language that has just its .po
+# source falls back to the original strings, so point at the missing build step
+if languages:
+    _catalog_base = os.path.join(LOCALE_DIR, languages[0], 'LC_MESSAGES',
+                                 APP_NAME)
+    if (not os.path.exists(_catalog_base + '.mo')
+            and os.path.exists(_catalog_base + '.po')):
+        logger.warning(
+            "Only %s.po exists for language '%s'; run apply_translations.sh "
+            "to compile it to %s.mo.", APP_NAME, languages[0], APP_NAME)
+    del _catalog_base
 
 # Set up the translation function using gettext
 try:
@@ -77,28 +109,261 @@ try:
     )
     # Get the function that performs the translation lookup
     _ = translation_obj.gettext
-    logging.info("Using language: %s",
-                 languages[0] if languages else 'en (fallback)')
+    logger.info("Using language: %s",
+                languages[0] if languages else 'en (fallback)')
 except FileNotFoundError:
     # Handle case where .mo files are missing even for the fallback
-    logging.warning(
+    logger.warning(
         "Locale files not found for %s at %s. Using default strings (English).",
         languages, LOCALE_DIR
     )
     _ = gettext.gettext  # Use a dummy function that returns the original string
 except Exception as e:  # pylint: disable=broad-except
     # Catch any other errors during gettext setup
-    logging.error("Error setting up gettext localization: %s", e)
+    logger.error("Error setting up gettext localization: %s", e)
     _ = gettext.gettext  # Fallback to original strings
 
+# Strings used for every progress message, translated once here (the module
+# global _ stays the translator: it is found faster than one in builtins)
+_PROCESSING = _("Processing...")
+_STARTING = _("Starting...")
+_DONE = _("Done")
+_FAILED = _("Failed")
+_PROGRESS_FORMAT = _("{items} items ({size})")
+# Translations of the status texts sent by the worker; the one with the
+# size of the file being copied is formatted per message
+_STATUS_TEXTS = {
+    "Scanning/Comparing...": _("Scanning/Comparing..."),
+    "Deleting...": _("Deleting..."),
+    "Entering dir...": _("Entering dir..."),
+    "Processing link...": _("Processing link..."),
+    "Processing file...": _("Processing file..."),
+    "Copying...": _("Copying..."),
+    "Directory done.": _("Directory done."),
+    "Scanning done.": _("Scanning done."),
+    "Waiting for cleared items to be deleted...":
+        _("Waiting for cleared items to be deleted..."),
+}
+_COPYING_SIZE_STATUS = "Copying ({size})..."
+_COPYING_SIZE_FORMAT = _("Copying ({size})...")
+# Static widget texts, translated once at import instead of each time the
+# widgets are built (keys name the widget a text belongs to)
+_LABELS = {
+    'title': _("PyBackup"),
+    'source_dir': _("Source Directory:"),
+    'browse': _("Browse..."),
+    'target_dirs': _("Target Directories:"),
+    'add': _("Add..."),
+    'remove': _("Remove"),
+    'options': _("Options"),
+    'free_space': _("Target Free Space (%):"),
+    'free_space_desc': _("Minimum percentage of disk space to leave free (0-90)."),
+    'retries': _("Copy Retries:"),
+    'retries_desc': _("Number of times to retry copying a file after an error (0+)."),
+    'delay': _("Retry Delay (s):"),
+    'delay_desc': _("Seconds to wait between failed copy attempts (0+)."),
+    'bulk_listing': _("Bulk Listing:"),
+    'bulk_listing_desc': _("List source directories in large batches (Linux; faster for huge directories)."),
+    'files': _("Files"),
+    'log_file': _("Log File Path:"),
+    'file_browse': _("..."),
+    'log_file_desc': _("File where operation logs will be written."),
+    'state_file': _("State File Path:"),
+    'state_file_desc': _("File used to store progress for resuming interrupted backups."),
+    'start': _("Start Backup >"),
+    'overall_progress': _("Overall Progress:"),
+    'item_path': _("Item Path"),
+    'status': _("Status"),
+    'current_target': _("Current Target"),
+    'logs': _("Logs"),
+    'pause': _("Pause"),
+    'resume': _("Resume"),
+    'cancel': _("Cancel"),
+    'summary': _("Backup Summary"),
+    'summary_initial': _("Backup finished/cancelled."),
+    'failed_items': _("Failed Items:"),
+    'close': _("Close"),
+    'yes': _("Yes"),
+    'no': _("No"),
+    'select_source': _("Select Source Directory"),
+    'add_target': _("Add Target Directory"),
+    'select_log_file': _("Select Log File"),
+    'log_files': _("Log files"),
+    'text_files': _("Text files"),
+    'select_state_file': _("Select State File"),
+    'state_files': _("State files"),
+    'all_files': _("All files"),
+}
+
 # --- Default Configuration Constants ---
 # These provide initial values shown in the GUI for configuration settings.
 
 DEFAULT_LOG_FILE = 'pybackup.log'
+# Kept from the JSON state file era, so an interrupted backup that used the
+# default still resumes; the file format is detected when it is read
 DEFAULT_RESUME_STATE_FILE = 'pybackup.json'
 DEFAULT_FREE_SPACE_PERCENTAGE = 10
 DEFAULT_COPY_RETRIES = 3
 DEFAULT_COPY_RETRY_DELAY_SECONDS = 10
+DEFAULT_BULK_LISTING = False
+
+# Queue polling intervals (ms): poll again soon while messages keep arriving,
+# back off while the queues are idle (doubling the interval after every
+# QUEUE_POLL_BACKOFF_CHECKS empty checks, up to QUEUE_POLL_MAX_IDLE_MS)
+QUEUE_POLL_BUSY_MS = 5
+QUEUE_POLL_IDLE_MS = 100
+QUEUE_POLL_MAX_IDLE_MS = 500
+QUEUE_POLL_BACKOFF_CHECKS = 2
+# Messages handled per queue and check; the rest wait for the next (busy) check
+QUEUE_MAX_MESSAGES_PER_CHECK = 500
+# Minimum interval (ms) between refreshes of the progress tree and label
+# (about the display refresh rate; the latest values are kept meanwhile)
+UI_REFRESH_INTERVAL_MS = 33
+# Log messages held for display; if the GUI falls this far behind, the
+# oldest ones are dropped instead of growing memory without bound
+LOG_QUEUE_MAX_MESSAGES = 8192
+# Lines kept in the progress page log view; older lines are removed from it
+LOG_DISPLAY_MAX_LINES = 2000
+# The source and target directories are checked in background threads before
+# a backup starts; their results are polled at this interval (ms), and a
+# directory that has not answered after the timeout (s) is reported
+DIR_PROBE_POLL_MS = 50
+DIR_PROBE_TIMEOUT_SECONDS = 30
+
+
+def _target_dir_key(abs_dir_path: str) -> str:
+    """
+    Return the key identifying a target directory among the configured ones.
+
+    Absolute paths naming the same directory get the same key: they are
+    case-folded where the platform's file names are not case sensitive
+    (os.path.normcase).
+    """
+    return os.path.normcase(abs_dir_path)
+
+
+class _BufferedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    RotatingFileHandler writing through a LOG_FILE_BUFFER_BYTES buffer.
+
+    StreamHandler flushes its stream after every record, which is one write
+    system call per log line; here only records of level WARNING and above
+    (retries, mismatches and failures of the backup) are flushed right
+    away, so a crash does not lose them; the rest reach the file when the
+    buffer fills or on flush() and close(). The file size is counted in
+    encoded bytes as records are written, as asking the stream for its
+    position (what the base class does for every record) would flush the
+    buffer.
+
+    The handler is created without a file (delay=True); open_log_file()
+    points it at the log file of each run, and records are dropped while
+    no file is open.
+    """
+
+    file_size = 0  # Bytes in the current log file
+
+    def open_log_file(self, path: str):
+        """
+        Write the following records to path, rotating an existing file first.
+
+        The current log file, if any, is flushed and closed first.
+
+        Args:
+            path: The log file (relative paths are relative to the current
+                  directory).
+
+        Raises:
+            OSError: If the file cannot be rotated or opened; no file is
+                     open afterwards.
+        """
+        self.acquire()  # The listener thread may be writing a record
+        try:
+            if self.stream is not None:
+                self.stream.close()
+                self.stream = None
+            self.baseFilename = os.path.abspath(path)
+            self.stream = self._open()
+            if self.file_size:
+                self.doRollover()  # Keep the previous run's log
+                self.stream = self._open()
+        finally:
+            self.release()
+
+    def _open(self):
+        stream = open(self.baseFilename, self.mode,  # pylint: disable=consider-using-with
+                      buffering=LOG_FILE_BUFFER_BYTES, encoding=self.encoding,
+                      errors=self.errors)
+        self.file_size = stream.tell()  # Appending to an existing file
+        return stream
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            if self.stream is None:
+                return  # No log file (see open_log_file)
+            msg = self.format(record) + self.terminator
+            # Bytes of msg in the file (non-ASCII text takes several each)
+            msg_size = len(msg.encode(self.encoding, self.errors or 'strict'))
+            if self.file_size and self.file_size + msg_size >= self.maxBytes:
+                self.doRollover()
+                self.stream = self._open()  # Resets file_size
+            self.stream.write(msg)
+            self.file_size += msg_size
+            if record.levelno >= logging.WARNING:
+                self.stream.flush()
+        except RecursionError:
+            raise
+        except Exception:  # pylint: disable=broad-except
+            self.handleError(record)
+
+
+class _LogQueueHandler(logging.Handler):
+    """
+    Logging handler appending records to the GUI's log message deque.
+
+    The records are shown in the progress page log view like the worker's
+    log messages, which are appended to the same deque.
+    """
+
+    def __init__(self, log_queue: collections.deque):
+        super().__init__()
+        self.log_queue = log_queue
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            # Prefixed with [GUI] to distinguish from core logic logs
+            self.log_queue.append({'level': record.levelno,
+                                   'message': f"[GUI] {record.getMessage()}"})
+        except Exception:  # pylint: disable=broad-except
+            self.handleError(record)
+
+
+def _clear_text(text_widget: tk.Text):
+    """
+    Delete the contents of a disabled Text widget.
+
+    An empty widget is left alone, without the state toggles and delete.
+    """
+    if text_widget.index('end-1c') != '1.0':
+        text_widget.config(state=tk.NORMAL)
+        text_widget.delete('1.0', tk.END)
+        text_widget.config(state=tk.DISABLED)
+
+
+def _grab_when_mapped(dialog: tk.Toplevel):
+    """
+    Make a new dialog modal (grab its input) once it is shown.
+
+    A grab fails on a window that is not viewable yet, as a Toplevel is
+    right after its creation (on X11 in particular), so it is taken from the
+    dialog's <Map> event instead.
+    """
+    def grab(event: tk.Event):
+        if event.widget is dialog:  # Not the <Map> of one of its children
+            try:
+                dialog.grab_set()
+            except tk.TclError:
+                pass  # Destroyed or unmapped again meanwhile
+    dialog.bind('<Map>', grab)
 
 
 # --- Main GUI Class ---
@@ -112,6 +377,20 @@ class PyBackupGUI:  # Renamed class
     the UI based on messages received from the worker via queues.
     """
 
+    # Spinbox options on the configuration page, one row each in the Options
+    # group: label key, value range, variable attribute, description key
+    _PAGE1_OPTIONS = (
+        ('free_space', 0, 90, 'free_perc_var', 'free_space_desc'),
+        ('retries', 0, 10, 'retries_var', 'retries_desc'),
+        ('delay', 0, 600, 'delay_var', 'delay_desc'),
+    )
+    # File paths on the configuration page, two rows each in the Files group:
+    # label key, variable attribute, browse method, description key
+    _PAGE1_FILES = (
+        ('log_file', 'log_file_var', '_browse_log_file', 'log_file_desc'),
+        ('state_file', 'state_file_var', '_browse_state_file', 'state_file_desc'),
+    )
+
     def __init__(self, root: tk.Tk):
         """
         Initialize the main application window, variables, and pages.
@@ -120,7 +399,7 @@ class PyBackupGUI:  # Renamed class
             root (tk.Tk): The main Tkinter window (root) instance.
         """
         self.root = root
-        self.root.title(_("PyBackup"))
+        self.root.title(_LABELS['title'])
         # Define behavior when user tries to close the window (red X button)
         self.root.protocol("WM_DELETE_WINDOW", self._on_closing)
 
@@ -130,33 +409,100 @@ class PyBackupGUI:  # Renamed class
         # --- Internal State Variables ---
         # Tkinter control variables linked directly to widgets
         self.source_dir = tk.StringVar()
+        # Absolute source path, recomputed only when source_dir is changed
+        # (used by every progress tree update)
+        self._abs_source_root: str = ""
+        self.source_dir.trace_add('write', self._recache_source_root)
         self.free_perc_var = tk.IntVar(value=DEFAULT_FREE_SPACE_PERCENTAGE)
         self.retries_var = tk.IntVar(value=DEFAULT_COPY_RETRIES)
         self.delay_var = tk.IntVar(value=DEFAULT_COPY_RETRY_DELAY_SECONDS)
+        self.bulk_listing_var = tk.BooleanVar(value=DEFAULT_BULK_LISTING)
         self.log_file_var = tk.StringVar(value=DEFAULT_LOG_FILE)
         self.state_file_var = tk.StringVar(value=DEFAULT_RESUME_STATE_FILE)
 
         # Internal list to store target directory paths added by the user
         self.target_dirs: List[str] = []
+        # Normalized keys (see _target_dir_key) of target_dirs, for O(1)
+        # duplicate checks that also catch equivalent spellings of a path
+        self._target_dir_keys: Set[str] = set()
         # Dictionary holding the current configuration to pass to core logic
         self.config: Dict[str, Any] = {
             'free_percent': self.free_perc_var.get(),
             'retries': self.retries_var.get(),
             'delay': self.delay_var.get(),
+            'bulk_listing': self.bulk_listing_var.get(),
             'log_file': self.log_file_var.get(),
             'state_file': self.state_file_var.get()
         }
         # Worker thread management
         self.backup_thread: Optional[threading.Thread] = None
-        self.progress_queue: queue.Queue = queue.Queue()  # For progress/status
-        self.log_queue: queue.Queue = queue.Queue()  # For log messages
-        self.pause_event: threading.Event = threading.Event()  # To signal pause
+        # For progress/status: a single producer and consumer and no join(),
+        # so the lock-free SimpleQueue is enough
+        self.progress_queue: queue.SimpleQueue = queue.SimpleQueue()
+        # For log messages: deque append/popleft are atomic, so neither the
+        # worker nor this thread takes a lock per message
+        self.log_queue: collections.deque = collections.deque(
+            maxlen=LOG_QUEUE_MAX_MESSAGES)
+        # GUI events are logged (console and log file) and displayed
+        self._log_display_handler = _LogQueueHandler(self.log_queue)
+        gui_event_logger.addHandler(self._log_display_handler)
+        # Set while running, cleared to pause (the worker blocks on it)
+        self.resume_event: threading.Event = threading.Event()
         self.cancel_event: threading.Event = threading.Event()  # To signal cancel
         # Application status flags
         self.is_running: bool = False
         self.is_paused: bool = False
-        # Tracks the target index for display purposes in the progress view
+        # Tracks the target index for display purposes in the progress view,
+        # and the target's path shown (set by _set_processing_target)
         self.current_processing_target_idx: int = 0
+        self.current_target_name: str = "N/A"
+        # Directory checks running before a start: absolute path -> future
+        # of _probe_dir, the time they are given up, and the modal dialog
+        # shown while they take long
+        self._probe_futures: Dict[str, Future] = {}
+        self._probe_deadline: float = 0.0
+        self._probe_dialog: Optional[tk.Toplevel] = None
+        # Yes/no question asked while a backup runs (see _ask_yes_no_async)
+        self._confirm_dialog: Optional[tk.Toplevel] = None
+        # (path, mtime, ctime) of a directory -> whether it is writable
+        self._probe_cache: Dict[Tuple[str, int, int], bool] = {}
+        # Thread writing the log records (started by the first run), its
+        # output handlers, and among them the one writing the run's log file
+        self._log_listener: Optional[logging.handlers.QueueListener] = None
+        self._log_handlers: List[logging.Handler] = []
+        self._file_handler: Optional[_BufferedRotatingFileHandler] = None
+        # The root logger's QueueHandler, and the root handlers it replaced
+        # (restored when the listener is stopped)
+        self._queue_handler: Optional[logging.handlers.QueueHandler] = None
+        self._replaced_root_handlers: List[logging.Handler] = []
+
+        # File dialogs, configured once and shown again on each browse (they
+        # also keep the directory last chosen in them as their initialdir)
+        self._source_dialog = filedialog.Directory(
+            self.root, title=_LABELS['select_source'], mustexist=True)
+        self._add_target_dialog = filedialog.Directory(
+            self.root, title=_LABELS['add_target'], mustexist=True)
+        self._log_file_dialog = filedialog.SaveAs(
+            self.root, title=_LABELS['select_log_file'],
+            defaultextension=".log",
+            filetypes=[(_LABELS['log_files'], "*.log"),
+                       (_LABELS['text_files'], "*.txt"),
+                       (_LABELS['all_files'], "*.*")])
+        self._state_file_dialog = filedialog.SaveAs(
+            self.root, title=_LABELS['select_state_file'],
+            # Same extension as the default state file name
+            defaultextension=".json",
+            filetypes=[(_LABELS['state_files'], "*.json"),
+                       (_LABELS['all_files'], "*.*")])
+        # The save dialogs open at the current file path setting; its
+        # directory is recomputed only when the setting changes
+        for file_var, file_dialog in ((self.log_file_var, self._log_file_dialog),
+                                      (self.state_file_var, self._state_file_dialog)):
+            file_var.trace_add(
+                'write',
+                lambda *_trace_args, var=file_var, dialog=file_dialog:
+                self._preset_file_dialog(dialog, var.get()))
+            self._preset_file_dialog(file_dialog, file_var.get())
 
         # --- Wizard Page Setup ---
         self.current_page: int = 0
@@ -177,12 +523,14 @@ class PyBackupGUI:  # Renamed class
         # Display the first page (configuration) initially
         self._show_page(0)
         # Start the periodic check for messages from the worker thread
+        self._idle_checks: int = 0  # Consecutive checks without messages
+        self._poll_idle_ms: int = QUEUE_POLL_IDLE_MS  # Current idle interval
         self.check_queues()
 
     def _show_page(self, page_index: int):
         """Hide all pages and display the page at the specified index."""
         if not 0 <= page_index < len(self.pages):
-            logging.error("Invalid page index requested: %d", page_index)
+            logger.error("Invalid page index requested: %d", page_index)
             return
         for i, page in enumerate(self.pages):
             if i == page_index:
@@ -201,15 +549,15 @@ class PyBackupGUI:  # Renamed class
         frame.columnconfigure(1, weight=1)
 
         # --- Source Directory Widgets ---
-        ttk.Label(frame, text=_("Source Directory:")).grid(
+        ttk.Label(frame, text=_LABELS['source_dir']).grid(
             row=0, column=0, sticky=tk.W, padx=2, pady=3)
         ttk.Entry(frame, textvariable=self.source_dir, width=60).grid(
             row=0, column=1, sticky=(tk.W, tk.E), padx=5, pady=3)
-        ttk.Button(frame, text=_("Browse..."), command=self._browse_source).grid(
+        ttk.Button(frame, text=_LABELS['browse'], command=self._browse_source).grid(
             row=0, column=2, sticky=tk.W, padx=2, pady=3)
 
         # --- Target Directories List ---
-        ttk.Label(frame, text=_("Target Directories:")).grid(
+        ttk.Label(frame, text=_LABELS['target_dirs']).grid(
             row=1, column=0, sticky=(tk.N, tk.W), padx=2, pady=(10, 3))
         # Use an outer frame to contain the listbox and its scrollbars
         target_outer_frame = ttk.Frame(frame)
@@ -236,115 +584,98 @@ class PyBackupGUI:  # Renamed class
         target_btn_frame = ttk.Frame(frame)
         target_btn_frame.grid(
             row=1, column=2, sticky=(tk.N, tk.W), padx=2, pady=3)
-        ttk.Button(target_btn_frame, text=_("Add..."),
+        ttk.Button(target_btn_frame, text=_LABELS['add'],
                    command=self._add_target).pack(fill=tk.X, pady=2)
-        ttk.Button(target_btn_frame, text=_("Remove"),
+        ttk.Button(target_btn_frame, text=_LABELS['remove'],
                    command=self._remove_target).pack(fill=tk.X, pady=2)
         # Allow the row containing the listbox setup to expand vertically
         frame.rowconfigure(1, weight=1)
 
         # --- Options Group ---
-        opts_frame = ttk.LabelFrame(frame, text=_("Options"), padding="5")
+        opts_frame = ttk.LabelFrame(frame, text=_LABELS['options'], padding="5")
         opts_frame.grid(
             row=2, column=0, columnspan=3, sticky=(tk.W, tk.E), padx=2, pady=10)
         opts_frame.columnconfigure(1, minsize=60)  # Ensure space for Spinbox
         # Allow description label to expand
         opts_frame.columnconfigure(2, weight=1)
 
-        # Option: Keep Free Space
-        ttk.Label(opts_frame, text=_("Target Free Space (%):")).grid(
-            row=0, column=0, sticky=tk.W, padx=5, pady=4)
-        ttk.Spinbox(opts_frame, from_=0, to=90, increment=1, width=5,
-                    textvariable=self.free_perc_var).grid(
-                        row=0, column=1, sticky=tk.W, padx=5, pady=4)
-        ttk.Label(opts_frame,
-                  text=_("Minimum percentage of disk space to leave free (0-90)."),
-                  font=self.desc_font, foreground="gray").grid(
-                      row=0, column=2, sticky=tk.W, padx=5, pady=4)
-
-        # Option: Copy Retries
-        ttk.Label(opts_frame, text=_("Copy Retries:")).grid(
-            row=1, column=0, sticky=tk.W, padx=5, pady=4)
-        ttk.Spinbox(opts_frame, from_=0, to=10, increment=1, width=5,
-                    textvariable=self.retries_var).grid(
-                        row=1, column=1, sticky=tk.W, padx=5, pady=4)
-        ttk.Label(opts_frame,
-                  text=_(
-                      "Number of times to retry copying a file after an error (0+)."),
+        # One row per option: label, spinbox, description
+        for row, (label_key, low, high, var_name, desc_key) in enumerate(
+                self._PAGE1_OPTIONS):
+            ttk.Label(opts_frame, text=_LABELS[label_key]).grid(
+                row=row, column=0, sticky=tk.W, padx=5, pady=4)
+            ttk.Spinbox(opts_frame, from_=low, to=high, increment=1, width=5,
+                        textvariable=getattr(self, var_name)).grid(
+                            row=row, column=1, sticky=tk.W, padx=5, pady=4)
+            ttk.Label(opts_frame, text=_LABELS[desc_key],
+                      font=self.desc_font, foreground="gray").grid(
+                          row=row, column=2, sticky=tk.W, padx=5, pady=4)
+        # Then the bulk listing switch: label, checkbox, description
+        row = len(self._PAGE1_OPTIONS)
+        ttk.Label(opts_frame, text=_LABELS['bulk_listing']).grid(
+            row=row, column=0, sticky=tk.W, padx=5, pady=4)
+        ttk.Checkbutton(opts_frame, variable=self.bulk_listing_var).grid(
+            row=row, column=1, sticky=tk.W, padx=5, pady=4)
+        ttk.Label(opts_frame, text=_LABELS['bulk_listing_desc'],
                   font=self.desc_font, foreground="gray").grid(
-                      row=1, column=2, sticky=tk.W, padx=5, pady=4)
-
-        # Option: Retry Delay
-        ttk.Label(opts_frame, text=_("Retry Delay (s):")).grid(
-            row=2, column=0, sticky=tk.W, padx=5, pady=4)
-        ttk.Spinbox(opts_frame, from_=0, to=600, increment=1, width=5,
-                    textvariable=self.delay_var).grid(
-                        row=2, column=1, sticky=tk.W, padx=5, pady=4)
-        ttk.Label(opts_frame,
-                  text=_("Seconds to wait between failed copy attempts (0+)."),
-                  font=self.desc_font, foreground="gray").grid(
-                      row=2, column=2, sticky=tk.W, padx=5, pady=4)
+                      row=row, column=2, sticky=tk.W, padx=5, pady=4)
 
         # --- File Paths Group ---
-        file_opts_frame = ttk.LabelFrame(frame, text=_("Files"), padding="5")
+        file_opts_frame = ttk.LabelFrame(frame, text=_LABELS['files'], padding="5")
         file_opts_frame.grid(
             row=3, column=0, columnspan=3, sticky=(tk.W, tk.E), padx=2, pady=10)
         # Allow entry field to expand
         file_opts_frame.columnconfigure(1, weight=1)
 
-        # Log File Path
-        ttk.Label(file_opts_frame, text=_("Log File Path:")).grid(
-            row=0, column=0, sticky=tk.W, padx=5, pady=2)
-        ttk.Entry(file_opts_frame, textvariable=self.log_file_var, width=50).grid(
-            row=0, column=1, sticky=(tk.W, tk.E), padx=5, pady=2)
-        ttk.Button(file_opts_frame, text=_("..."), width=3,
-                   command=self._browse_log_file).grid(
-                       row=0, column=2, sticky=tk.W, padx=2)
-        ttk.Label(file_opts_frame,
-                  text=_("File where operation logs will be written."),
-                  font=self.desc_font, foreground="gray").grid(
-                      row=1, column=1, columnspan=2, sticky=tk.W, padx=5, pady=(0, 5))
-
-        # State File Path
-        ttk.Label(file_opts_frame, text=_("State File Path:")).grid(
-            row=2, column=0, sticky=tk.W, padx=5, pady=2)
-        ttk.Entry(file_opts_frame, textvariable=self.state_file_var, width=50).grid(
-            row=2, column=1, sticky=(tk.W, tk.E), padx=5, pady=2)
-        ttk.Button(file_opts_frame, text=_("..."), width=3,
-                   command=self._browse_state_file).grid(
-                       row=2, column=2, sticky=tk.W, padx=2)
-        ttk.Label(file_opts_frame,
-                  text=_(
-                      "File used to store progress for resuming interrupted backups."),
-                  font=self.desc_font, foreground="gray").grid(
-                      row=3, column=1, columnspan=2, sticky=tk.W, padx=5, pady=(0, 5))
+        # Two rows per file: label, entry and browse button, then description
+        for index, (label_key, var_name, browse_name, desc_key) in enumerate(
+                self._PAGE1_FILES):
+            row = 2 * index
+            ttk.Label(file_opts_frame, text=_LABELS[label_key]).grid(
+                row=row, column=0, sticky=tk.W, padx=5, pady=2)
+            ttk.Entry(file_opts_frame, textvariable=getattr(self, var_name),
+                      width=50).grid(
+                          row=row, column=1, sticky=(tk.W, tk.E), padx=5, pady=2)
+            ttk.Button(file_opts_frame, text=_LABELS['file_browse'], width=3,
+                       command=getattr(self, browse_name)).grid(
+                           row=row, column=2, sticky=tk.W, padx=2)
+            ttk.Label(file_opts_frame, text=_LABELS[desc_key],
+                      font=self.desc_font, foreground="gray").grid(
+                          row=row + 1, column=1, columnspan=2, sticky=tk.W,
+                          padx=5, pady=(0, 5))
 
         # --- Navigation ---
         # Frame to hold the start button, aligned to the right
         nav_frame = ttk.Frame(frame)
         nav_frame.grid(row=4, column=0, columnspan=3, sticky=tk.E, pady=15)
         # Use default themed button
-        start_button = ttk.Button(nav_frame, text=_(
-            "Start Backup >"), command=self._start_backup)
+        start_button = ttk.Button(nav_frame, text=_LABELS['start'],
+                                  command=self._start_backup)
         start_button.pack()
 
+    def _recache_source_root(self, *_trace_args):
+        """Recompute the cached absolute source path (source_dir trace)."""
+        source = self.source_dir.get()
+        self._abs_source_root = os.path.abspath(source) if source else ""
+
     def _browse_source(self):
         """Open directory dialog to select the source directory."""
-        dir_path = filedialog.askdirectory(
-            title=_("Select Source Directory"), mustexist=True
-        )
+        dir_path = self._source_dialog.show()
         if dir_path:
             self.source_dir.set(dir_path)
 
     def _add_target(self):
         """Open directory dialog to add a target directory to the list."""
-        dir_path = filedialog.askdirectory(
-            title=_("Add Target Directory"), mustexist=True
-        )
+        dir_path = self._add_target_dialog.show()
         # Add only if a path was selected and it's not already present
-        if dir_path and dir_path not in self.target_dirs:
-            self.target_dirs.append(dir_path)
-            self.target_listbox.insert(tk.END, dir_path)  # Add to GUI listbox
+        if dir_path:
+            # Stored absolute, so later checks and the worker can use it as is
+            dir_path = os.path.abspath(dir_path)
+            dir_key = _target_dir_key(dir_path)
+            if dir_key not in self._target_dir_keys:
+                self._target_dir_keys.add(dir_key)
+                self.target_dirs.append(dir_path)
+                self.target_listbox.insert(tk.END, dir_path)  # Add to GUI listbox
 
     def _remove_target(self):
         """Remove selected target(s) from the listbox and internal list."""
@@ -354,34 +685,42 @@ class PyBackupGUI:  # Renamed class
         # Iterate in reverse order to handle index changes correctly during deletion
         for i in sorted(selected_indices, reverse=True):
             try:
-                del self.target_dirs[i]  # Remove from internal list
+                # Remove from internal list and its key set
+                self._target_dir_keys.discard(
+                    _target_dir_key(self.target_dirs.pop(i)))
                 self.target_listbox.delete(i)  # Remove from GUI listbox
             except IndexError:
                 # Log error if index is somehow invalid during deletion
-                logging.warning("Failed to remove target at index %d.", i)
+                logger.warning("Failed to remove target at index %d.", i)
+
+    @staticmethod
+    def _preset_file_dialog(file_dialog: filedialog.SaveAs, path: str):
+        """
+        Make a save dialog suggest the given file path when next shown.
+
+        Args:
+            file_dialog: The dialog to preset.
+            path: File path setting (relative paths are relative to the
+                  current directory).
+        """
+        if path:
+            initial_dir, initial_file = os.path.split(os.path.abspath(path))
+        else:
+            initial_dir, initial_file = os.getcwd(), ""
+        file_dialog.options['initialdir'] = initial_dir
+        file_dialog.options['initialfile'] = initial_file
 
     def _browse_log_file(self):
         """Open file dialog to select or specify a log file path."""
-        path = filedialog.asksaveasfilename(
-            title=_("Select Log File"),
-            defaultextension=".log",
-            initialfile=self.log_file_var.get(),  # Suggest current value
-            filetypes=[(_("Log files"), "*.log"),
-                       (_("Text files"), "*.txt"),
-                       (_("All files"), "*.*")]
-        )
+        # Opens at the current value (preset when the setting changed)
+        path = self._log_file_dialog.show()
         if path:
             self.log_file_var.set(path)
 
     def _browse_state_file(self):
         """Open file dialog to select or specify a state file path."""
-        path = filedialog.asksaveasfilename(
-            title=_("Select State File"),
-            defaultextension=".json",
-            initialfile=self.state_file_var.get(),  # Suggest current value
-            filetypes=[(_("JSON files"), "*.json"),
-                       (_("All files"), "*.*")]
-        )
+        # Opens at the current value (preset when the setting changed)
+        path = self._state_file_dialog.show()
         if path:
             self.state_file_var.set(path)
 
@@ -395,9 +734,9 @@ class PyBackupGUI:  # Renamed class
         # Frame for overall progress text display (items/size)
         info_frame = ttk.Frame(frame)
         info_frame.grid(row=0, column=0, sticky=(tk.W, tk.E), pady=(0, 5))
-        ttk.Label(info_frame, text=_("Overall Progress:")).pack(side=tk.LEFT)
+        ttk.Label(info_frame, text=_LABELS['overall_progress']).pack(side=tk.LEFT)
         self.progress_label = ttk.Label(
-            info_frame, text=_("Starting..."))  # NOSONAR
+            info_frame, text=_STARTING)  # NOSONAR
         self.progress_label.pack(side=tk.LEFT, padx=5)
 
         # Frame for the Treeview (directory structure) and its scrollbars
@@ -412,9 +751,9 @@ class PyBackupGUI:  # Renamed class
         self.tree = ttk.Treeview(
             tree_frame, columns=("status", "target"), show="tree headings"
         )
-        self.tree.heading("#0", text=_("Item Path"))  # Implicit tree column
-        self.tree.heading("status", text=_("Status"))
-        self.tree.heading("target", text=_("Current Target"))
+        self.tree.heading("#0", text=_LABELS['item_path'])  # Implicit tree column
+        self.tree.heading("status", text=_LABELS['status'])
+        self.tree.heading("target", text=_LABELS['current_target'])
         # Configure column properties (widths, stretching behavior)
         # Path column can stretch
         self.tree.column("#0", width=400, stretch=tk.YES)
@@ -436,9 +775,25 @@ class PyBackupGUI:  # Renamed class
 
         # Dictionary mapping source paths to Treeview item IDs for efficient updates
         self.tree_item_map: Dict[str, str] = {}
+        # Source paths of the displayed branch below the root, by depth, and
+        # the column values last set per item ID (to skip unchanged updates)
+        self._tree_branch: List[str] = []
+        self._tree_values: Dict[str, tuple] = {}
+        # (source path, source root) of the last tree update and the path
+        # components below the root it was split into
+        self._tree_parts_memo: Tuple[Optional[Tuple[str, str]], Tuple[str, ...]] = (None, ())
+        # Arguments of the latest tree update received from the worker;
+        # applied once, from an idle callback, after the queue is drained
+        self._pending_tree_update: Optional[tuple] = None
+        self._tree_update_scheduled: bool = False  # _apply_tree_update is due
+        # Latest (items, bytes) of the progress_update messages not shown
+        # yet; the progress label is set once from it
+        self._pending_progress: Optional[Tuple[int, int]] = None
+        # Earliest time.monotonic() for the next progress/tree refresh
+        self._next_display_refresh: float = 0.0
 
         # Frame for the log display area
-        log_frame = ttk.LabelFrame(frame, text=_("Logs"), padding="5")
+        log_frame = ttk.LabelFrame(frame, text=_LABELS['logs'], padding="5")
         log_frame.grid(row=2, column=0, sticky=(
             tk.W, tk.E, tk.N, tk.S), pady=5)
         frame.rowconfigure(2, weight=1)  # Give log area some vertical weight
@@ -456,10 +811,10 @@ class PyBackupGUI:  # Renamed class
         control_frame = ttk.Frame(frame)
         control_frame.grid(row=3, column=0, sticky=(tk.W, tk.E), pady=(10, 0))
 
-        self.pause_resume_btn = ttk.Button(control_frame, text=_("Pause"),
+        self.pause_resume_btn = ttk.Button(control_frame, text=_LABELS['pause'],
                                            command=self._toggle_pause, state=tk.DISABLED)
         self.pause_resume_btn.pack(side=tk.LEFT, padx=5)
-        self.cancel_btn = ttk.Button(control_frame, text=_("Cancel"),
+        self.cancel_btn = ttk.Button(control_frame, text=_LABELS['cancel'],
                                      command=self._cancel_backup, state=tk.DISABLED)
         self.cancel_btn.pack(side=tk.LEFT, padx=5)
 
@@ -469,9 +824,12 @@ class PyBackupGUI:  # Renamed class
         """
         Update the Treeview to show only the active directory branch and status.
 
-        Clears existing entries and rebuilds the path from the root source
-        directory down to the currently processed item. Displays status and
-        destination path information appropriately for leaf and parent nodes.
+        The displayed branch is kept between calls: nodes it shares with the
+        path of the currently processed item are reused and only updated when
+        their values change, the part of the old branch that diverges is
+        deleted and the missing nodes are inserted. The tree is only cleared
+        when the source root changes. Displays status and destination path
+        information appropriately for leaf and parent nodes.
 
         Args:
             source_path: Absolute path of the source item being processed.
@@ -480,111 +838,153 @@ class PyBackupGUI:  # Renamed class
             full_destination_path: Full destination path for the item (leaf node).
         """
         try:
-            # Clear previous entries for simplicity in active-path display
-            for i in self.tree.get_children():
-                self.tree.delete(i)
-            self.tree_item_map.clear()  # Reset path-to-ID map
-
-            if not source_path or not self.source_dir.get():
+            abs_source_root = self._abs_source_root
+            if not source_path or not abs_source_root:
                 return  # Nothing to display
 
-            abs_source_path = os.path.abspath(source_path)
-            abs_source_root = os.path.abspath(self.source_dir.get())
-
             # --- Setup Root Node ---
-            root_name = os.path.basename(abs_source_root) or abs_source_root
             root_iid = "root"  # Use a fixed, predictable ID for the root
-            root_status = _("Processing...") if status else ""  # NOSONAR
-            # Root node always shows the base target name in the target column
-            root_values = (root_status, current_target_base_name)
-            self.tree.insert(
-                "", tk.END, iid=root_iid, text=root_name, open=True, values=root_values
-            )
-            self.tree_item_map[abs_source_root] = root_iid
+            if (self.tree_item_map.get(abs_source_root) != root_iid
+                    or not self.tree.exists(root_iid)):
+                # First update or a different source root: start over
+                self.tree.delete(*self.tree.get_children())
+                self.tree_item_map.clear()  # Reset path-to-ID map
+                self._tree_branch.clear()
+                self._tree_values.clear()
+                root_name = os.path.basename(abs_source_root) or abs_source_root
+                self.tree.insert(
+                    "", tk.END, iid=root_iid, text=root_name, open=True
+                )
+                self.tree_item_map[abs_source_root] = root_iid
+            root_status = _PROCESSING if status else ""  # NOSONAR
             current_parent_iid = root_iid  # Start building path from root
 
+            sep = os.sep  # Looked up once for the path building below
+            # Path components below the root, reused while successive
+            # messages are about the same item
+            memo_key = (source_path, abs_source_root)
+            if self._tree_parts_memo[0] == memo_key:
+                parts = self._tree_parts_memo[1]
+            else:
+                abs_source_path = os.path.abspath(source_path)
+                # Calculate relative path safely, handles path outside root error
+                try:
+                    rel_path = os.path.relpath(abs_source_path, abs_source_root)
+                except ValueError:
+                    # Log error and indicate issue in the tree root display
+                    logger.warning(
+                        "Item path %s outside root %s.", abs_source_path, abs_source_root
+                    )
+                    self._set_tree_values(root_iid, (
+                        _("Error path"), current_target_base_name))
+                    return
+                # Without empty parts (e.g. from a leading '/'); the root
+                # itself gives '.', i.e. no parts
+                parts = () if rel_path == os.curdir else tuple(
+                    part for part in rel_path.split(sep) if part)
+                self._tree_parts_memo = (memo_key, parts)
+
             # If the item being processed IS the root, update it and finish
-            if abs_source_path == abs_source_root:
-                self.tree.item(root_iid, values=(
-                    status, current_target_base_name))
+            if not parts:
+                self._prune_tree_branch(0)
+                self._set_tree_values(
+                    root_iid, (status, current_target_base_name))
                 self.tree.see(root_iid)
                 return
 
+            # Root node always shows the base target name in the target column
+            self._set_tree_values(
+                root_iid, (root_status, current_target_base_name))
+
             # --- Build Path Nodes ---
-            # Calculate relative path safely, handles path outside root error
-            try:
-                rel_path = os.path.relpath(abs_source_path, abs_source_root)
-            except ValueError:
-                # Log error and indicate issue in the tree root display
-                logging.warning(
-                    "Item path %s outside root %s.", abs_source_path, abs_source_root
-                )
-                self.tree.item(root_iid, values=(
-                    _("Error path"), current_target_base_name))
-                return
+            # Node paths are built by appending to these (join with '' only
+            # adds a separator where the root does not already end with one)
+            source_prefix = os.path.join(abs_source_root, '')
+            target_prefix = os.path.join(current_target_base_name, '')
+            current_rel = ""  # Relative path of the node being added/found
+            branch = self._tree_branch  # Source paths of displayed nodes, by depth
+            depth = 0
 
-            parts = rel_path.split(os.sep)
-            built_source_path = abs_source_root  # Tracks absolute source path being built
+            last_index = len(parts) - 1
 
-            # Insert/find nodes for the current path components
+            # Reuse or insert nodes for the current path components
             for i, part in enumerate(parts):
-                if not part:
-                    # Skip potential empty parts from split (e.g., leading '/')
-                    continue
                 parent_iid = current_parent_iid  # Parent for the node being added/found
-                built_source_path = os.path.join(
-                    built_source_path, part)  # Update path for map key
-                iid = self.tree_item_map.get(
-                    built_source_path)  # Check if already mapped
+                current_rel = current_rel + sep + part if current_rel else part
+                built_source_path = source_prefix + current_rel  # Map key
                 # Is this the final part (leaf node)?
-                is_last = i == len(parts) - 1
+                is_last = i == last_index
 
-                # Insert node if it doesn't exist in the map/tree yet
-                if not iid or not self.tree.exists(iid):
+                if depth < len(branch) and branch[depth] == built_source_path:
+                    # Node is already displayed at this depth
+                    iid = self.tree_item_map[built_source_path]
+                else:
+                    # The displayed branch diverges here: drop its remainder
+                    # and insert the node for this path component
+                    self._prune_tree_branch(depth)
                     iid = self.tree.insert(
                         parent_iid, tk.END, text=part, open=True)
                     # Store new ID in map
                     self.tree_item_map[built_source_path] = iid
-                else:
-                    # Ensure existing node is expanded
-                    self.tree.item(iid, open=True)
+                    branch.append(built_source_path)
+                depth += 1
 
                 # Determine Status and Target Text for this Node
-                node_status = status if is_last else _("Processing...")
+                node_status = status if is_last else _PROCESSING
                 if is_last:
                     # Leaf node: Use the full destination path if provided, else base name
                     node_target = full_destination_path if full_destination_path \
                         else current_target_base_name
                 else:
-                    # Intermediate node: Construct its corresponding destination path
-                    try:
-                        # Get parts up to current index
-                        current_rel_parts = parts[:i+1]
-                        current_rel_path_for_node = os.path.join(
-                            *current_rel_parts)
-                        node_target = os.path.join(
-                            current_target_base_name, current_rel_path_for_node
-                        )
-                    except (OSError, ValueError) as path_err:
-                        # Fallback to base name if intermediate path calculation fails
-                        logging.warning(
-                            "Could not calculate intermediate dest path: %s", path_err
-                        )
-                        node_target = current_target_base_name
+                    # Intermediate node: its corresponding destination path
+                    node_target = target_prefix + current_rel
                 # Update the values shown in the Treeview columns for this item
-                self.tree.item(iid, values=(node_status, node_target))
+                self._set_tree_values(iid, (node_status, node_target))
                 current_parent_iid = iid  # The current node becomes parent for the next part
 
+            # Nodes below the current item belong to a previous, deeper item
+            self._prune_tree_branch(depth)
+
             # Ensure the last item (leaf node) is visible after update
             if current_parent_iid:
                 self.tree.see(current_parent_iid)
 
         except tk.TclError as e:
             # Catch Tkinter errors gracefully if widget becomes invalid during update
-            logging.warning("TclError updating tree display: %s", e)
+            logger.warning("TclError updating tree display: %s", e)
         except Exception as e:  # pylint: disable=broad-except
             # Catch any other unexpected errors during tree update
-            logging.exception("Error updating tree display: %s", e)
+            logger.exception("Error updating tree display: %s", e)
+
+    def _prune_tree_branch(self, depth: int):
+        """
+        Remove the displayed branch nodes from the given depth downwards.
+
+        Deleting the topmost of them removes the whole subtree from the
+        Treeview in a single call.
+
+        Args:
+            depth: Depth below the root of the first node to remove.
+        """
+        branch = self._tree_branch
+        if depth >= len(branch):
+            return
+        self.tree.delete(self.tree_item_map[branch[depth]])
+        for path in branch[depth:]:
+            self._tree_values.pop(self.tree_item_map.pop(path), None)
+        del branch[depth:]
+
+    def _set_tree_values(self, iid: str, values: tuple):
+        """
+        Set the column values of a Treeview item if they changed.
+
+        Args:
+            iid: Treeview item ID.
+            values: Status and target column values.
+        """
+        if self._tree_values.get(iid) != values:
+            self.tree.item(iid, values=values)
+            self._tree_values[iid] = values
 
     # --- Page 3: Summary ---
 
@@ -593,17 +993,17 @@ class PyBackupGUI:  # Renamed class
         frame = self.page3_summary
         frame.columnconfigure(0, weight=1)  # Allow content to expand
 
-        ttk.Label(frame, text=_("Backup Summary"), font="-weight bold").grid(
+        ttk.Label(frame, text=_LABELS['summary'], font="-weight bold").grid(
             row=0, column=0, pady=10)
         self.summary_label = ttk.Label(
-            frame, text=_("Backup finished/cancelled."))
+            frame, text=_LABELS['summary_initial'])
         self.summary_label.grid(row=1, column=0, pady=5, sticky=tk.W)
         # Label to display final item/size statistics
         self.stats_label = ttk.Label(frame, text="")
         self.stats_label.grid(row=2, column=0, pady=5, sticky=tk.W)
 
         # Section for displaying failed items
-        ttk.Label(frame, text=_("Failed Items:")).grid(
+        ttk.Label(frame, text=_LABELS['failed_items']).grid(
             row=3, column=0, pady=(10, 0), sticky=tk.W)
         self.failed_text = scrolledtext.ScrolledText(
             frame, height=10, wrap=tk.WORD, state=tk.DISABLED)
@@ -616,15 +1016,96 @@ class PyBackupGUI:  # Renamed class
         nav_frame = ttk.Frame(frame)
         nav_frame.grid(row=5, column=0, sticky=tk.E, pady=10)
         # Use default button style
-        ttk.Button(nav_frame, text=_("Close"),
-                   command=self.root.destroy).pack()
+        ttk.Button(nav_frame, text=_LABELS['close'],
+                   command=self._close_window).pack()
 
     # --- Actions and Event Handlers ---
 
-    def _validate_config(self) -> bool:
-        """Validate user inputs on the configuration page before starting."""
-        source = self.source_dir.get()
-        if not source or not os.path.isdir(source):
+    def _probe_dir(self, abs_path: str) -> Tuple[bool, bool]:
+        """
+        Check whether a path is a directory and whether it is writable.
+
+        Runs in a background thread. The writability check is cached per
+        path and modification/change time, so checking an unchanged
+        directory again costs a single stat.
+
+        Args:
+            abs_path: Absolute path of the directory to check.
+
+        Returns:
+            Whether abs_path is a directory, and whether it is writable.
+        """
+        try:
+            dir_stat = os.stat(abs_path)
+        except (OSError, ValueError):
+            return False, False
+        if not stat.S_ISDIR(dir_stat.st_mode):
+            return False, False
+        cache_key = (abs_path, dir_stat.st_mtime_ns, dir_stat.st_ctime_ns)
+        writable = self._probe_cache.get(cache_key)
+        if writable is None:
+            writable = os.access(abs_path, os.W_OK)
+            self._probe_cache[cache_key] = writable
+        return True, writable
+
+    def _run_dir_probe(self, abs_path: str, future: Future):
+        """Run _probe_dir in a background thread, setting future's result."""
+        try:
+            future.set_result(self._probe_dir(abs_path))
+        except Exception as e:  # pylint: disable=broad-except
+            future.set_exception(e)
+
+    def _poll_dir_probes(self):
+        """
+        Wait for the directory checks without blocking the Tk event loop.
+
+        Reschedules itself until all checks are done or have timed out,
+        showing a modal progress dialog if they take long, then continues
+        starting the backup with their results.
+        """
+        futures = self._probe_futures
+        if (not all(future.done() for future in futures.values())
+                and time.monotonic() < self._probe_deadline):
+            if self._probe_dialog is None:
+                self._probe_dialog = self._create_probe_dialog()
+            self.root.after(DIR_PROBE_POLL_MS, self._poll_dir_probes)
+            return
+        if self._probe_dialog is not None:
+            self._probe_dialog.grab_release()
+            self._probe_dialog.destroy()
+            self._probe_dialog = None
+        self._probe_futures = {}
+        # None marks a directory that did not answer in time
+        probes = {path: future.result() if future.done() else None
+                  for path, future in futures.items()}
+        self._start_probed_backup(probes)
+
+    def _create_probe_dialog(self) -> tk.Toplevel:
+        """Create the modal dialog shown while directories are checked."""
+        dialog = tk.Toplevel(self.root)
+        dialog.title(_LABELS['title'])
+        dialog.transient(self.root)
+        dialog.resizable(False, False)
+        # The checks cannot be interrupted, so the dialog cannot be closed
+        dialog.protocol("WM_DELETE_WINDOW", lambda: None)
+        ttk.Label(dialog, text=_("Checking directories..."),
+                  padding=10).pack()
+        progress_bar = ttk.Progressbar(dialog, mode='indeterminate', length=250)
+        progress_bar.pack(padx=10, pady=(0, 10))
+        progress_bar.start()
+        _grab_when_mapped(dialog)  # Keep input away from the wizard meanwhile
+        return dialog
+
+    def _validate_config(self, probes: Dict[str, Optional[Tuple[bool, bool]]]) -> bool:
+        """
+        Validate user inputs on the configuration page before starting.
+
+        Args:
+            probes: Absolute paths of the source and target directories mapped
+                    to their _probe_dir result (None if it did not answer).
+        """
+        source_probe = probes.get(self._abs_source_root)  # None if unset
+        if not source_probe or not source_probe[0]:
             messagebox.showerror(
                 _("Error"), _("Please select a valid source directory.")
             )
@@ -635,11 +1116,17 @@ class PyBackupGUI:  # Renamed class
             )
             return False
 
-        # Validate target directories, attempt creation if confirmed by user
-        validated_targets = []
-        for target in self.target_dirs:
-            abs_target = os.path.abspath(target)  # Ensure absolute paths
-            if not os.path.isdir(abs_target):
+        # Validate target directories (absolute since _add_target), attempt
+        # creation if confirmed by user
+        for abs_target in self.target_dirs:
+            target_probe = probes.get(abs_target)
+            if target_probe is None:
+                msg = _("Target directory '{path}' is not responding.").format(
+                    path=abs_target)
+                messagebox.showerror(_("Error"), msg)
+                return False
+            is_dir, writable = target_probe
+            if not is_dir:
                 # Ask user if non-existent target should be created
                 q_title = _("Confirm Target Creation")
                 q_msg = _(
@@ -650,7 +1137,6 @@ class PyBackupGUI:  # Renamed class
                     try:
                         # Attempt to create directory
                         os.makedirs(abs_target, exist_ok=True)
-                        validated_targets.append(abs_target)
                     except OSError as e:
                         # Catch specific OS errors during creation
                         msg = _("Could not create target '{path}': {error}").format(
@@ -673,14 +1159,11 @@ class PyBackupGUI:  # Renamed class
                     return False
             else:
                 # Check writability if directory already exists
-                if not os.access(abs_target, os.W_OK):
+                if not writable:
                     msg = _("Target directory '{path}' is not writable.").format(
                         path=abs_target)
                     messagebox.showerror(_("Error"), msg)
                     return False
-                validated_targets.append(abs_target)
-        # Store the validated, absolute target paths
-        self.target_dirs = validated_targets
 
         # Validate numeric options and file paths from GUI variables
         try:
@@ -688,6 +1171,7 @@ class PyBackupGUI:  # Renamed class
             self.config['free_percent'] = self.free_perc_var.get()
             self.config['retries'] = self.retries_var.get()
             self.config['delay'] = self.delay_var.get()
+            self.config['bulk_listing'] = self.bulk_listing_var.get()
             self.config['log_file'] = self.log_file_var.get()
             self.config['state_file'] = self.state_file_var.get()
 
@@ -712,34 +1196,68 @@ class PyBackupGUI:  # Renamed class
         return True
 
     def _start_backup(self):
-        """Validate config and start the backup process in a worker thread."""
+        """
+        Check the source and target directories, then start the backup.
+
+        The directories are checked in background threads, so a slow or
+        unreachable (e.g. network) target does not freeze the window;
+        _poll_dir_probes continues once all checks are done.
+        """
+        # Prevent starting if already running or still checking
+        if self.is_running or self._probe_futures:
+            return
+        # Unique absolute paths, in order (the source first; targets are
+        # stored absolute)
+        abs_paths = list(dict.fromkeys(
+            path for path in [self._abs_source_root] + self.target_dirs
+            if path))
+        if not abs_paths:
+            self._start_probed_backup({})  # Reports the missing source
+            return
+        # One daemon thread per check: a thread stuck on an unreachable
+        # directory must not keep the program from exiting (the threads of
+        # a ThreadPoolExecutor are joined at interpreter exit)
+        self._probe_futures = {}
+        for path in abs_paths:
+            future: Future = Future()
+            self._probe_futures[path] = future
+            threading.Thread(target=self._run_dir_probe, args=(path, future),
+                             daemon=True).start()
+        self._probe_deadline = time.monotonic() + DIR_PROBE_TIMEOUT_SECONDS
+        self.root.after(DIR_PROBE_POLL_MS, self._poll_dir_probes)
+
+    def _start_probed_backup(self, probes: Dict[str, Optional[Tuple[bool, bool]]]):
+        """
+        Validate config and start the backup process in a worker thread.
+
+        Args:
+            probes: Directory check results, as taken by _validate_config.
+        """
         # Prevent starting if validation fails or already running
-        if not self._validate_config() or self.is_running:
+        if not self._validate_config(probes) or self.is_running:
             return
 
         # Set running state and reset controls/events
         self.is_running = True
         self.is_paused = False
-        self.pause_event.clear()
+        self.resume_event.set()
         self.cancel_event.clear()
-        self.current_processing_target_idx = 0  # Start with first target index
+        self._set_processing_target(0)  # Start with first target index
 
         # Update button states for progress page
-        self.pause_resume_btn.config(text=_("Pause"), state=tk.NORMAL)
-        self.cancel_btn.config(text=_("Cancel"), state=tk.NORMAL)
+        self.pause_resume_btn.config(text=_LABELS['pause'], state=tk.NORMAL)
+        self.cancel_btn.config(text=_LABELS['cancel'], state=tk.NORMAL)
 
         # Reset progress/summary displays for new run
         initial_target_name = self.target_dirs[0] if self.target_dirs else ""
         self._update_tree_display(
-            self.source_dir.get(), _("Starting..."), initial_target_name
+            self.source_dir.get(), _STARTING, initial_target_name
         )
-        self.progress_label.config(text=_("Starting..."))
+        self.progress_label.config(text=_STARTING)
         # Clear log and failed items text areas safely
         for text_widget in [self.log_text, self.failed_text]:
             try:
-                text_widget.config(state=tk.NORMAL)
-                text_widget.delete('1.0', tk.END)
-                text_widget.config(state=tk.DISABLED)
+                _clear_text(text_widget)
             except tk.TclError:
                 pass  # Ignore if widget destroyed
 
@@ -747,41 +1265,7 @@ class PyBackupGUI:  # Renamed class
         self.stats_label.config(text="")
 
         # --- Reconfigure File Logging for this Run ---
-        log_level = logging.getLogger().level  # Preserve current log level
-        # Remove previous file/stream handlers to avoid duplication or permission issues
-        logger = logging.getLogger()  # Use root logger
-        for handler in logger.handlers[:]:
-            logger.removeHandler(handler)
-            handler.close()
-        # Setup logging again with potentially new file path from config
-        try:
-            # Use basicConfig (convenience function) - needs force=True for reconfig
-            logging.basicConfig(
-                level=log_level,
-                format='%(asctime)s - %(levelname)s - %(message)s',
-                handlers=[
-                    logging.FileHandler(
-                        self.config['log_file'], mode='w', encoding='utf-8'),
-                    logging.StreamHandler(sys.stdout)  # Keep console output
-                ],
-                force=True  # Allow reconfiguring root logger in Python 3.8+
-            )
-            logging.info("Logging reconfigured to file: %s",
-                         self.config['log_file'])
-        except IOError as e:
-            # Catch specific file errors
-            print(f"Error setting up log file handler for {self.config['log_file']}: {e}",
-                  file=sys.stderr)
-            # Fallback to console only if file logging fails
-            logging.basicConfig(
-                level=log_level, format='%(asctime)s - %(levelname)s - %(message)s',
-                handlers=[logging.StreamHandler(sys.stdout)], force=True)
-        except Exception as e:  # pylint: disable=broad-except
-            # Catch other potential errors
-            print(f"Error re-setting log file handler: {e}", file=sys.stderr)
-            logging.basicConfig(
-                level=log_level, format='%(asctime)s - %(levelname)s - %(message)s',
-                handlers=[logging.StreamHandler(sys.stdout)], force=True)
+        self._setup_run_logging()
 
         # Switch view to progress page and log start
         self._show_page(1)
@@ -798,80 +1282,318 @@ class PyBackupGUI:  # Renamed class
                 self.config['state_file'],
                 self.progress_queue,
                 self.log_queue,
-                self.pause_event,
+                self.resume_event,
                 self.cancel_event
             ),
             daemon=True  # Allows main GUI thread to exit even if worker is stuck
         )
         self.backup_thread.start()
 
+    def _setup_run_logging(self):
+        """
+        Route log records of this run to the log file and the console.
+
+        The logging pipeline is built by the first run and then kept: later
+        runs let the listener write out the records still queued, then
+        point its file handler at their log file. The log file is
+        written through a buffer (flushed right away on errors) and rotated
+        at LOG_FILE_MAX_BYTES; an existing log file is rotated first, so
+        each run starts a new one.
+        """
+        if self._log_listener is None:
+            self._start_log_listener()
+        else:
+            # Earlier records belong to the previous log file
+            self._log_listener.stop()
+            self._log_listener.start()
+        try:
+            self._file_handler.open_log_file(self.config['log_file'])
+        except OSError as e:
+            # Fallback to console only if file logging fails
+            print(f"Error setting up log file handler for {self.config['log_file']}: {e}",
+                  file=sys.stderr)
+        else:
+            logger.info("Logging reconfigured to file: %s",
+                        self.config['log_file'])
+
+    def _start_log_listener(self):
+        """
+        Replace the root handlers with a QueueHandler and its listener.
+
+        Logging calls of any thread then just enqueue the record; a
+        QueueListener thread writes them to the console and the log file.
+        The replaced handlers are kept for _stop_log_listener.
+        """
+        # Remove previous handlers to avoid duplicate console output
+        root_logger = logging.getLogger()  # Use root logger
+        self._replaced_root_handlers = root_logger.handlers[:]
+        for handler in self._replaced_root_handlers:
+            root_logger.removeHandler(handler)
+
+        formatter = logging.Formatter(LOG_FORMAT)
+        console_handler = logging.StreamHandler(sys.stdout)  # Keep console output
+        console_handler.setFormatter(formatter)
+        # No file is opened yet (see _setup_run_logging)
+        self._file_handler = _BufferedRotatingFileHandler(
+            DEFAULT_LOG_FILE, maxBytes=LOG_FILE_MAX_BYTES,
+            backupCount=LOG_FILE_BACKUP_COUNT, encoding='utf-8', delay=True)
+        self._file_handler.setFormatter(formatter)
+        # Flushed and closed in order
+        self._log_handlers = [console_handler, self._file_handler]
+
+        record_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._queue_handler = logging.handlers.QueueHandler(record_queue)
+        root_logger.addHandler(self._queue_handler)
+        self._log_listener = logging.handlers.QueueListener(
+            record_queue, *self._log_handlers, respect_handler_level=True)
+        self._log_listener.start()
+
+    def _flush_run_logging(self):
+        """Write out the log records buffered for the log file."""
+        for handler in self._log_handlers:
+            handler.flush()
+
+    def _stop_log_listener(self):
+        """
+        Stop the log listener, writing and closing its handlers.
+
+        The root logger gets back the handlers the QueueHandler replaced, so
+        records logged afterwards (e.g. errors on the way out of main) still
+        reach the console.
+        """
+        if self._log_listener is None:
+            return
+        root_logger = logging.getLogger()
+        root_logger.removeHandler(self._queue_handler)
+        self._queue_handler = None
+        for handler in self._replaced_root_handlers:
+            root_logger.addHandler(handler)
+        self._replaced_root_handlers = []
+        self._log_listener.stop()  # Handles the records still queued
+        self._log_listener = None
+        for handler in self._log_handlers:
+            handler.close()
+        self._log_handlers = []
+        self._file_handler = None
+
+    def _close_window(self):
+        """Write out pending log records, then close the main window."""
+        gui_event_logger.removeHandler(self._log_display_handler)
+        self._stop_log_listener()
+        self.root.destroy()
+
     def _toggle_pause(self):
         """Toggle the pause/resume state of the backup process."""
         if not self.is_running:
             return  # Do nothing if not running
         if self.is_paused:
             # Resume the backup
-            self.pause_event.clear()  # Signal worker thread to continue
-            self.pause_resume_btn.config(text=_("Pause"))
+            self.resume_event.set()  # Signal worker thread to continue
+            self.pause_resume_btn.config(text=_LABELS['pause'])
             self.is_paused = False
             self._add_log(logging.INFO, _("Backup Resumed."))
         else:
             # Pause the backup
-            self.pause_event.set()  # Signal worker thread to pause
-            self.pause_resume_btn.config(text=_("Resume"))
+            self.resume_event.clear()  # Signal worker thread to pause
+            self.pause_resume_btn.config(text=_LABELS['resume'])
             self.is_paused = True
             self._add_log(logging.INFO, _("Backup Paused."))
 
+    def _ask_yes_no_async(self, title: str, message: str, on_yes):
+        """
+        Ask a yes/no question without blocking the Tk event loop.
+
+        Unlike messagebox.askyesno, which runs a nested (on some platforms
+        native) event loop until it is answered, this dialog is an ordinary
+        Toplevel: check_queues keeps draining the worker's messages while
+        the user decides. The dialog is modal for the input of the main
+        window. Only one question is asked at a time: a new one replaces a
+        question still open (e.g. closing the window while the cancel
+        question is shown asks the exit question instead).
+
+        Args:
+            title: Title of the dialog window.
+            message: The question.
+            on_yes: Called without arguments if the user answers yes.
+        """
+        if self._confirm_dialog is not None:
+            # Dropped without an answer (its on_yes is not called)
+            self._confirm_dialog.grab_release()
+            self._confirm_dialog.destroy()
+        dialog = tk.Toplevel(self.root)
+        dialog.title(title)
+        dialog.transient(self.root)
+        dialog.resizable(False, False)
+        self._confirm_dialog = dialog
+
+        def answer(yes: bool):
+            dialog.grab_release()
+            dialog.destroy()
+            self._confirm_dialog = None
+            if yes:
+                on_yes()
+
+        ttk.Label(dialog, text=message, padding=10,
+                  justify=tk.LEFT).pack()
+        button_frame = ttk.Frame(dialog, padding=(10, 0, 10, 10))
+        button_frame.pack()
+        yes_btn = ttk.Button(button_frame, text=_LABELS['yes'],
+                             command=lambda: answer(True))
+        no_btn = ttk.Button(button_frame, text=_LABELS['no'],
+                            command=lambda: answer(False))
+        # Same keys and default answer as messagebox.askyesno: Return
+        # answers with the focused button, Escape and closing mean no
+        for button in (yes_btn, no_btn):
+            button.pack(side=tk.LEFT, padx=5)
+            button.bind('<Return>', lambda event: event.widget.invoke())
+        dialog.protocol("WM_DELETE_WINDOW", lambda: answer(False))
+        dialog.bind('<Escape>', lambda _event: answer(False))
+        yes_btn.focus_set()
+        _grab_when_mapped(dialog)  # Keep input away from the main window
+
     def _cancel_backup(self):
         """Request cancellation of the backup process after confirmation."""
         if not self.is_running:
             return  # Do nothing if not running
-        # Ask user for confirmation
-        if messagebox.askyesno(
-            _("Cancel Backup"), _("Cancel backup process?"), icon='warning'
-        ):
-            self.cancel_event.set()  # Signal worker thread to cancel
-            # Update GUI immediately for responsiveness
-            self.pause_resume_btn.config(state=tk.DISABLED)
-            self.cancel_btn.config(text=_("Cancelling..."), state=tk.DISABLED)
-            self._add_log(logging.WARNING, _("Cancellation requested..."))
+        # Ask user for confirmation; the backup goes on meanwhile
+        self._ask_yes_no_async(
+            _("Cancel Backup"), _("Cancel backup process?"),
+            self._request_cancel)
+
+    def _request_cancel(self):
+        """Signal the worker to cancel (once the user has confirmed it)."""
+        if not self.is_running:
+            return  # The backup ended while the user was deciding
+        self.cancel_event.set()  # Signal worker thread to cancel
+        self.resume_event.set()  # Wake the worker up if it is paused
+        # Update GUI immediately for responsiveness
+        self.pause_resume_btn.config(state=tk.DISABLED)
+        self.cancel_btn.config(text=_("Cancelling..."), state=tk.DISABLED)
+        self._add_log(logging.WARNING, _("Cancellation requested..."))
 
     def _add_log(self, level: int, message: str):
-        """Add a log message originating from the GUI thread to the queue."""
-        # Prefix with [GUI] to distinguish from core logic logs if desired
-        self.log_queue.put({'level': level, 'message': f"[GUI] {message}"})
+        """Log an event of the GUI thread; it is also shown in the log view."""
+        gui_event_logger.log(level, message)
 
     def check_queues(self):
-        """Periodically check the progress and log queues for messages."""
-        # Process all available messages in the progress queue non-blockingly
+        """
+        Periodically check the progress and log queues for messages.
+
+        At most QUEUE_MAX_MESSAGES_PER_CHECK messages are taken from each
+        queue per tick, so a burst cannot keep the Tk thread busy for long;
+        the next check then follows after QUEUE_POLL_BUSY_MS. Tree updates and
+        the overall progress are coalesced, since only the latest values are
+        still visible once all of them are applied, and refreshed at most
+        every UI_REFRESH_INTERVAL_MS (see _refresh_progress_display). The log
+        lines of the tick are appended to the log widget in one insert.
+        Without messages, the interval between checks grows up to
+        QUEUE_POLL_MAX_IDLE_MS.
+        """
+        drained_count = 0  # Messages taken from both queues in this check
+        # Process available messages in the progress queue non-blockingly
         try:
-            while True:
+            for _unused in range(QUEUE_MAX_MESSAGES_PER_CHECK):
                 message = self.progress_queue.get_nowait()
-                self.handle_progress_message(message)
+                drained_count += 1
+                if message.get('type') == 'batch':
+                    # Several (type, fields) events coalesced by the worker
+                    for event_type, fields in message['events']:
+                        fields['type'] = event_type
+                        self.handle_progress_message(fields)
+                else:
+                    self.handle_progress_message(message)
         except queue.Empty:
             pass  # No progress messages currently
+        # Show the latest progress and tree update, if the refresh is due
+        refresh_wait_ms = self._refresh_progress_display()
 
-        # Process all available messages in the log queue non-blockingly
+        # Collect available messages in the log queue non-blockingly
+        log_records = []
+        log_queue = self.log_queue
         try:
-            while True:
-                log_record = self.log_queue.get_nowait()
-                self.display_log_message(log_record)
-        except queue.Empty:
-            pass  # No log messages currently
+            for _unused in range(QUEUE_MAX_MESSAGES_PER_CHECK):
+                log_records.append(log_queue.popleft())
+        except IndexError:
+            pass  # No more log messages currently
+        if log_records:
+            drained_count += len(log_records)
+            self.display_log_messages(log_records)
 
         # Reschedule this check if the main window still exists
         # This forms the basis of the GUI's responsiveness while the worker runs
         if self.root.winfo_exists():
-            self.root.after(100, self.check_queues)  # Check again in 100ms
+            # Check again soon while messages are flowing, later (and less
+            # often the longer it lasts) when idle
+            if drained_count:
+                self._idle_checks = 0
+                self._poll_idle_ms = QUEUE_POLL_IDLE_MS
+                delay_ms = QUEUE_POLL_BUSY_MS
+            elif refresh_wait_ms:
+                delay_ms = refresh_wait_ms  # Show what is still pending
+            else:
+                self._idle_checks += 1
+                if self._idle_checks % QUEUE_POLL_BACKOFF_CHECKS == 0:
+                    self._poll_idle_ms = min(
+                        self._poll_idle_ms * 2, QUEUE_POLL_MAX_IDLE_MS)
+                delay_ms = self._poll_idle_ms
+            self.root.after(delay_ms, self.check_queues)
+
+    def _refresh_progress_display(self) -> int:
+        """
+        Show the pending overall progress and tree update, if any.
+
+        The widgets are refreshed at most every UI_REFRESH_INTERVAL_MS, so a
+        fast stream of messages does not redraw them more often than can be
+        seen; until then only the latest values are kept. The tree update is
+        applied when Tk is idle, so input and redraws are handled first.
+
+        Returns:
+            Milliseconds until the values still pending can be shown, or 0
+            if nothing is left pending.
+        """
+        if self._pending_progress is None and self._pending_tree_update is None:
+            return 0
+        now = time.monotonic()
+        wait_ms = int((self._next_display_refresh - now) * 1000)
+        if wait_ms > 0:
+            return wait_ms
+        self._next_display_refresh = now + UI_REFRESH_INTERVAL_MS / 1000
+        if self._pending_progress is not None:
+            total_items, total_bytes = self._pending_progress
+            self._pending_progress = None
+            self.progress_label.config(text=_PROGRESS_FORMAT.format(
+                items=total_items, size=self._human_readable_size(total_bytes)
+            ))
+        if self._pending_tree_update is not None and not self._tree_update_scheduled:
+            self._tree_update_scheduled = True
+            self.root.after_idle(self._apply_tree_update)
+        return 0
+
+    def _apply_tree_update(self):
+        """Apply the latest pending tree update (scheduled with after_idle)."""
+        self._tree_update_scheduled = False
+        pending_update = self._pending_tree_update
+        self._pending_tree_update = None
+        if pending_update is not None:
+            self._update_tree_display(*pending_update)
+
+    def _set_processing_target(self, index: int):
+        """
+        Set the index of the target being written to and its display name.
+
+        The name is looked up here, as the index only changes at the start
+        and on 'target_switch', instead of for every progress message.
+        """
+        self.current_processing_target_idx = index
+        if 0 <= index < len(self.target_dirs):
+            self.current_target_name = self.target_dirs[index]
+        else:
+            self.current_target_name = "N/A"  # Default if index is somehow invalid
 
     def handle_progress_message(self, message: Dict[str, Any]):
         """Process messages received from the backup worker thread via queue."""
         msg_type = message.get('type')
-
-        # Determine the current target directory name safely for display
-        current_target_name = "N/A"  # Default if index is somehow invalid
-        if 0 <= self.current_processing_target_idx < len(self.target_dirs):
-            current_target_name = self.target_dirs[self.current_processing_target_idx]
+        current_target_name = self.current_target_name  # For display
 
         # Extract common payload elements
         full_dest_path = message.get('destination_path')
@@ -884,24 +1606,16 @@ class PyBackupGUI:  # Renamed class
             path_for_status = message.get(
                 'item') or message.get('current_dir', '')
             # Map known internal status texts to translated UI texts
-            status_map = {
-                "Scanning/Comparing...": _("Scanning/Comparing..."),
-                "Deleting...": _("Deleting..."),
-                "Entering dir...": _("Entering dir..."),
-                "Processing link...": _("Processing link..."),
-                "Processing file...": _("Processing file..."),
-                "Copying...": _("Copying..."),
-                "Copying ({size})...": _("Copying ({size})...").format(
-                    size=message.get('size_hr', '')),
-                "Directory done.": _("Directory done."),
-                "Scanning done.": _("Scanning done.")
-            }
-            display_status = status_map.get(
-                status_text, status_text)  # Fallback
+            if status_text == _COPYING_SIZE_STATUS:
+                display_status = _COPYING_SIZE_FORMAT.format(
+                    size=message.get('size_hr', ''))
+            else:
+                display_status = _STATUS_TEXTS.get(
+                    status_text, status_text)  # Fallback
             # Pass full dest path only if the status relates to a specific item
             dest_for_display = full_dest_path if message.get('item') else None
             if path_for_status:
-                self._update_tree_display(
+                self._pending_tree_update = (
                     path_for_status, display_status, current_target_name,
                     dest_for_display
                 )
@@ -909,41 +1623,39 @@ class PyBackupGUI:  # Renamed class
         elif msg_type == 'item_start':
             # Indicates processing starts for a specific item
             if source_path:
-                self._update_tree_display(
-                    source_path, _("Processing..."), current_target_name,
+                self._pending_tree_update = (
+                    source_path, _PROCESSING, current_target_name,
                     full_dest_path
                 )
 
         elif msg_type == 'item_done':
             # Indicates processing finished for a specific item (file/link)
-            status = _("Done") if message.get('success') else _("Failed")
+            status = _DONE if message.get('success') else _FAILED
             if source_path:
-                self._update_tree_display(
+                self._pending_tree_update = (
                     source_path, status, current_target_name, full_dest_path
                 )
 
         elif msg_type == 'progress_update':
-            # Updates overall statistics display (items and size)
-            total_items = message.get('items_processed', 0)
-            total_bytes = message.get('size_copied', 0)
-            progress_str = _("{items} items ({size})").format(
-                items=total_items, size=self._human_readable_size(total_bytes)
-            )
-            self.progress_label.config(text=progress_str)
+            # Updates overall statistics display (items and size); shown by
+            # check_queues once the queue is drained
+            self._pending_progress = (message.get('items_processed', 0),
+                                      message.get('size_copied', 0))
 
         elif msg_type == 'target_switch':
-            # Updates the GUI's tracking of the current target index
-            self.current_processing_target_idx = message.get('index', 0)
-            # current_target_name used in display will update on the next message
+            # Updates the GUI's tracking of the current target index (used
+            # in the display from the next message)
+            self._set_processing_target(message.get('index', 0))
 
         elif msg_type == 'done' or msg_type == 'error' or msg_type == 'cancelled':
             # Handles completion, cancellation, or fatal error from worker thread
+            self._flush_run_logging()  # Do not leave the run's end buffered
             self.is_running = False
             self.is_paused = False
             # Ensure controls are disabled on final page
             self.pause_resume_btn.config(state=tk.DISABLED)
             self.cancel_btn.config(
-                text=_("Cancel"), state=tk.DISABLED)  # Reset text
+                text=_LABELS['cancel'], state=tk.DISABLED)  # Reset text
 
             # Set summary message based on outcome
             summary_msg = _("Backup Finished Successfully.")
@@ -958,6 +1670,8 @@ class PyBackupGUI:  # Renamed class
             total_items = message.get('total_items', 0)
             total_size = message.get('total_size', 0)
             failed = message.get('failed_items', [])
+            # Only the most recent failures are sent; all are in the file
+            failed_count = message.get('failed_count', len(failed))
             stats_display = _(
                 "Items processed (run): {items}\n"
                 "Data copied (run): {size}"
@@ -966,31 +1680,53 @@ class PyBackupGUI:  # Renamed class
             )
             self.stats_label.config(text=stats_display)
 
-            # Display list of failed items
-            self.failed_text.config(state=tk.NORMAL)
-            self.failed_text.delete('1.0', tk.END)
+            # Display list of failed items, built as one string so the widget
+            # gets a single insert however many failures there are
             if failed:
-                self.failed_text.insert(
-                    tk.END, _("Path: Reason") + "\n" + "="*20 + "\n")
-                for item, reason in failed:
-                    # Ensure reason is safely converted to string
-                    reason_str = str(
-                        reason) if reason is not None else _("Unknown")
-                    self.failed_text.insert(tk.END, f"{item}: {reason_str}\n")
+                unknown = _("Unknown")
+                lines = [_("Path: Reason"), "=" * 20]
+                # Ensure reason is safely converted to string
+                lines.extend(
+                    f"{item}: {unknown if reason is None else reason}"
+                    for item, reason in failed)
+                if failed_count > len(failed):
+                    lines.append(_(
+                        "... {shown} of {count} failures shown, all are listed in {file}"
+                    ).format(shown=len(failed), count=failed_count,
+                             file=message.get('failures_file', '')))
+                lines.append("")  # Final newline
+                failed_display = "\n".join(lines)
             else:
-                self.failed_text.insert(tk.END, _("None") + "\n")
+                failed_display = _("None") + "\n"
+            _clear_text(self.failed_text)  # Usually emptied at the run start
+            # Made editable once, around the single insert
+            self.failed_text.config(state=tk.NORMAL)
+            self.failed_text.insert(tk.END, failed_display)
             self.failed_text.config(state=tk.DISABLED)
 
             # Automatically switch view to the summary page
             self._show_page(2)
 
-    def display_log_message(self, log_record: Dict[str, Any]):
-        """Append a log message to the Text widget in a thread-safe way."""
-        message = log_record.get('message', '')
+    def display_log_messages(self, log_records: List[Dict[str, Any]]):
+        """
+        Append log messages to the Text widget in a single insert.
+
+        Only the last LOG_DISPLAY_MAX_LINES lines are kept, so the widget does
+        not keep growing (and slowing down) during long backups.
+        """
+        text = ''.join(
+            log_record.get('message', '') + '\n' for log_record in log_records)
         try:
-            # Ensure widget updates happen in the main GUI thread
-            self.log_text.config(state=tk.NORMAL)  # Must be normal to insert
-            self.log_text.insert(tk.END, message + '\n')
+            # Ensure widget updates happen in the main GUI thread; made
+            # editable once per tick, around its single insert
+            self.log_text.config(state=tk.NORMAL)
+            self.log_text.insert(tk.END, text)
+            # The text ends with a newline, so the line of 'end-1c' is empty
+            # and the widget holds one line less than its number
+            last_line = int(self.log_text.index('end-1c').split('.')[0])
+            if last_line - 1 > LOG_DISPLAY_MAX_LINES:
+                self.log_text.delete(
+                    '1.0', f'{last_line - LOG_DISPLAY_MAX_LINES}.0')
             self.log_text.see(tk.END)  # Auto-scroll to the latest message
             self.log_text.config(state=tk.DISABLED)  # Set back to disabled
         except tk.TclError:
@@ -1009,23 +1745,18 @@ class PyBackupGUI:  # Renamed class
                 "Backup is in progress. Are you sure you want to exit?\n"
                 "This will cancel the backup."
             )
-            if messagebox.askyesno(title, msg, icon='warning'):
-                self.cancel_event.set()  # Signal worker thread to cancel
-                self.root.destroy()  # Close the window
-            # else: User clicked No, do nothing
+            self._ask_yes_no_async(title, msg, self._cancel_and_close)
         else:
             # If not running, close window immediately
-            self.root.destroy()
-
-    # Static method helper for consistent size formatting within the GUI
-    @staticmethod
-    def _human_readable_size(size_bytes: float) -> str:
-        """Convert bytes to a human-readable string (KB, MB, GB, TB)."""
-        if size_bytes == 0:
-            return "0B"
-        size_name = ("B", "KB", "MB", "GB", "TB", "PB", "EB", "ZB", "YB")
-        i = 0
-        while size_bytes >= 1024 and i < len(size_name) - 1:
-            size_bytes /= 1024.0
-            i += 1
-        return f"{size_bytes:.2f} {size_name[i]}"
+            self._close_window()
+
+    def _cancel_and_close(self):
+        """Signal the worker to cancel, then close the window."""
+        self.cancel_event.set()  # Signal worker thread to cancel
+        self.resume_event.set()  # Wake the worker up if it is paused
+        self._close_window()  # Close the window
+
+    # Static method helper for consistent size formatting within the GUI:
+    # the core's formatter, which picks the unit from the bit length of the
+    # size instead of dividing in a loop (same output as the worker's messages)
+    _human_readable_size = staticmethod(pybackup_core.human_readable_size)